@@ -5,6 +5,14 @@ Argument-Definitionen für den Smart Energy Manager CLI.
 import logging
 from typing import Dict, Any, List
 
+# Erlaubte Log-Level für --log-level
+_LOG_LEVELS: Dict[str, int] = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR
+}
+
 ARGUMENT_GROUPS: Dict[str, Dict[str, Any]] = {
     'connection': {
         'description': 'Verbindung',
@@ -18,7 +26,6 @@ ARGUMENT_GROUPS: Dict[str, Dict[str, Any]] = {
             {
                 'name': '--timeout',
                 'type': int,
-                'default': 5,
                 'help': 'Timeout für API-Anfragen in Sekunden (Standard: 5)',
                 'config_path': 'connection.request_timeout'
             }
@@ -129,11 +136,10 @@ ARGUMENT_GROUPS: Dict[str, Dict[str, Any]] = {
             },
             {
                 'name': '--log-level',
-                'choices': ['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-                'default': 'INFO',
+                'choices': list(_LOG_LEVELS),
                 'help': 'Log-Level für Konsole und Datei (Standard: INFO)',
                 'config_path': 'logging.log_level',
-                'config_value': lambda args: getattr(logging, args.log_level)
+                'config_value': lambda args: _LOG_LEVELS[args.log_level]
             },
             {
                 'name': '--no-daily-stats-logging',
@@ -339,14 +345,12 @@ ARGUMENT_GROUPS: Dict[str, Dict[str, Any]] = {
             {
                 'name': '--api-port',
                 'type': int,
-                'default': 8000,
                 'help': 'Port für API Server (Standard: 8000)',
                 'config_path': 'api.port'
             },
             {
                 'name': '--api-host',
                 'type': str,
-                'default': '0.0.0.0',
                 'help': 'Host für API Server (Standard: 0.0.0.0)',
                 'config_path': 'api.host'
             }
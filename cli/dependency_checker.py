@@ -2,22 +2,25 @@
 Dependency Checker für den Smart Energy Manager.
 """
 
+import os
 import sys
-import subprocess
 import importlib.util
-from typing import Dict, List, Tuple, Optional
+from typing import List, Tuple
 
-# Erforderliche Dependencies
-REQUIRED_DEPENDENCIES: Dict[str, str] = {
-    'requests': 'requests>=2.31.0',
-    'rich': 'rich>=13.7.0',
-    'phue': 'phue>=1.1',
-}
+# Erforderliche Dependencies: (module_name, pip_package)
+REQUIRED_DEPENDENCIES: Tuple[Tuple[str, str], ...] = (
+    ('requests', 'requests>=2.31.0'),
+    ('rich', 'rich>=13.7.0'),
+    ('phue', 'phue>=1.1'),
+)
 
-OPTIONAL_DEPENDENCIES: Dict[str, str] = {
-    'fastapi': 'fastapi>=0.104.0',
-    'uvicorn': 'uvicorn>=0.24.0',
-}
+OPTIONAL_DEPENDENCIES: Tuple[Tuple[str, str], ...] = (
+    ('fastapi', 'fastapi>=0.104.0'),
+    ('uvicorn', 'uvicorn>=0.24.0'),
+)
+
+# Antworten, die als Zustimmung zur Installation gelten (leer = Enter)
+_YES_ANSWERS = frozenset({'j', 'ja', 'y', 'yes', ''})
 
 
 def check_dependencies(skip_check: bool = False, with_api: bool = False) -> bool:
@@ -26,12 +29,13 @@ def check_dependencies(skip_check: bool = False, with_api: bool = False) -> bool
 
     Args:
         skip_check: Wenn True, wird die Prüfung übersprungen
+            (ebenso bei SKIP_DEPENDENCY_CHECK=true in der Umgebung)
         with_api: Wenn True, werden auch API-Dependencies geprüft
 
     Returns:
         True wenn alle Dependencies verfügbar sind, False sonst
     """
-    if skip_check:
+    if skip_check or os.getenv("SKIP_DEPENDENCY_CHECK", "False").lower() == "true":
         return True
 
     # Sammle fehlende Dependencies
@@ -39,7 +43,7 @@ def check_dependencies(skip_check: bool = False, with_api: bool = False) -> bool
 
     # Prüfe API-Dependencies wenn --api gesetzt
     if with_api:
-        for module_name, pip_package in OPTIONAL_DEPENDENCIES.items():
+        for module_name, pip_package in OPTIONAL_DEPENDENCIES:
             if not _check_single_dependency(module_name, pip_package):
                 missing_deps.append((module_name, pip_package))
 
@@ -69,7 +73,8 @@ def _check_single_dependency(module_name: str, pip_package: str) -> bool:
     Returns:
         True wenn installiert, False sonst
     """
-    return importlib.util.find_spec(module_name) is not None
+    # Bereits importierte Module brauchen keine Suche über die Finder
+    return module_name in sys.modules or importlib.util.find_spec(module_name) is not None
 
 
 def _find_missing_dependencies() -> List[Tuple[str, str]]:
@@ -80,7 +85,7 @@ def _find_missing_dependencies() -> List[Tuple[str, str]]:
         Liste von Tupeln (module_name, pip_package)
     """
     missing = []
-    for module_name, pip_package in REQUIRED_DEPENDENCIES.items():
+    for module_name, pip_package in REQUIRED_DEPENDENCIES:
         if not _check_single_dependency(module_name, pip_package):
             missing.append((module_name, pip_package))
     return missing
@@ -107,7 +112,7 @@ def _ask_for_installation() -> bool:
     """
     try:
         response = input("\nSollen die fehlenden Pakete automatisch installiert werden? (j/n): ")
-        return response.lower() in ['j', 'ja', 'y', 'yes', '']
+        return response.strip().lower() in _YES_ANSWERS
     except KeyboardInterrupt:
         print("\nInstallation abgebrochen.")
         return False
@@ -125,10 +130,14 @@ def _install_missing_dependencies(missing_deps: List[Tuple[str, str]]) -> bool:
     """
     print("\nInstalliere fehlende Pakete...")
 
+    # Alle Pakete mit einem pip-Aufruf installieren
+    pip_packages = [pip_package for _, pip_package in missing_deps]
     failed_installs = []
-    for module_name, pip_package in missing_deps:
-        if not _install_dependency(pip_package):
-            failed_installs.append(pip_package)
+    if not _install_dependency(*pip_packages):
+        # Einzeln nachinstallieren, um die fehlerhaften Pakete zu ermitteln
+        for pip_package in pip_packages:
+            if not _install_dependency(pip_package):
+                failed_installs.append(pip_package)
 
     if failed_installs:
         _display_failed_installations(failed_installs)
@@ -144,20 +153,24 @@ def _install_missing_dependencies(missing_deps: List[Tuple[str, str]]) -> bool:
     return True
 
 
-def _install_dependency(pip_package: str) -> bool:
+def _install_dependency(*pip_packages: str) -> bool:
     """
-    Installiert ein einzelnes Package.
+    Installiert ein oder mehrere Packages mit einem pip-Aufruf.
 
     Args:
-        pip_package: Package-Name mit Version für pip install
+        pip_packages: Package-Namen mit Version für pip install
 
     Returns:
         True bei erfolgreicher Installation, False sonst
     """
+    # Nur für die Installation benötigt
+    import subprocess
+
     try:
-        print(f"Installiere {pip_package}...")
+        print(f"Installiere {', '.join(pip_packages)}...")
         subprocess.check_call(
-            [sys.executable, '-m', 'pip', 'install', pip_package],
+            [sys.executable, '-m', 'pip', 'install',
+             '--disable-pip-version-check', '--no-input', *pip_packages],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT
         )
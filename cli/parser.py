@@ -3,9 +3,23 @@ ArgumentParser für den Smart Energy Manager.
 """
 
 import argparse
+import sys
 from typing import Dict, Any
 from .arguments import ARGUMENT_GROUPS
 
+# Epilog-Text mit Beispielen für --help
+_EPILOG = """
+Beispiele:
+  python main.py                          # Standard-Ausführung mit Gerätesteuerung
+  python main.py --ip 192.168.178.100     # Andere IP-Adresse
+  python main.py --interval 10            # Update alle 10 Sekunden
+  python main.py --no-colors              # Ohne farbige Ausgabe
+  python main.py --simple                 # Einzeilige Ausgabe für kleine Displays
+
+Weitere Informationen:
+  python main.py --help                   # Diese Hilfe anzeigen
+"""
+
 
 def create_parser() -> argparse.ArgumentParser:
     """
@@ -17,7 +31,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Fronius Solar Monitor - Überwacht Ihre Solaranlage in Echtzeit",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=_get_epilog_text()
+        epilog=_EPILOG
     )
 
     # Füge alle Argument-Gruppen hinzu
@@ -33,28 +47,34 @@ def parse_arguments():
     Returns:
         Namespace mit geparsten Argumenten
     """
+    # Ohne Argumente gelten nur Defaults - Parser muss nicht gebaut werden
+    if len(sys.argv) <= 1:
+        return _default_namespace(ARGUMENT_GROUPS)
+
     parser = create_parser()
     return parser.parse_args()
 
 
-def _get_epilog_text() -> str:
+def _default_namespace(groups: Dict[str, Dict[str, Any]]) -> argparse.Namespace:
     """
-    Gibt den Epilog-Text für den Parser zurück.
+    Erstellt den Namespace, den parse_args() ohne Argumente liefern würde.
+
+    Args:
+        groups: Dictionary mit Argument-Gruppen-Definitionen
 
     Returns:
-        Epilog-Text mit Beispielen
+        Namespace mit den Standardwerten aller Argumente
     """
-    return """
-Beispiele:
-  python main.py                          # Standard-Ausführung mit Gerätesteuerung
-  python main.py --ip 192.168.178.100     # Andere IP-Adresse
-  python main.py --interval 10            # Update alle 10 Sekunden
-  python main.py --no-colors              # Ohne farbige Ausgabe
-  python main.py --simple                 # Einzeilige Ausgabe für kleine Displays
+    defaults: Dict[str, Any] = {}
+    for group_config in groups.values():
+        for arg_config in group_config['arguments']:
+            action = arg_config.get('action')
+            if action == 'version':
+                continue
 
-Weitere Informationen:
-  python main.py --help                   # Diese Hilfe anzeigen
-"""
+            dest = arg_config['name'].lstrip('-').replace('-', '_')
+            defaults[dest] = arg_config.get('default', False if action == 'store_true' else None)
+    return argparse.Namespace(**defaults)
 
 
 def _add_arguments_from_config(parser: argparse.ArgumentParser,
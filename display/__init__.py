@@ -4,7 +4,7 @@ Display Package für den Smart Energy Manager.
 
 from .display_manager import DisplayManager
 from .displays import SolarDisplay, DeviceDisplay, StatsDisplay, SimpleDisplay
-from .core import ColorManager, Formatter, Colors, Layout
+from .core import ColorManager, NullColorManager, Formatter, Colors, Layout
 from .components import Header, Table, ProgressBar, Separator
 from .themes import DefaultTheme, MinimalTheme
 
@@ -20,6 +20,7 @@ __all__ = [
 
     # Core-Komponenten
     "ColorManager",
+    "NullColorManager",
     "Formatter",
     "Colors",
     "Layout",
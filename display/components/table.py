@@ -77,14 +77,13 @@ class Table:
             label_width: Breite der Label-Spalte
             value_width: Breite der Wert-Spalte
         """
-        formatted_value = self._format_value(value, value_width)
+        value_str = f"{self._format_value(value, value_width)} {unit}"
 
-        if self.color_manager and color:
-            colored_value = self.color_manager.colorize(f"{formatted_value} {unit}", color)
-        else:
-            colored_value = f"{formatted_value} {unit}"
+        # Ohne Farbe direkt ausgeben (kein ANSI-Wrap)
+        if color and self.color_manager:
+            value_str = self.color_manager.colorize(value_str, color)
 
-        print(f"{label:<{label_width}} {colored_value}")
+        print(f"{label:<{label_width}} {value_str}")
 
     def _calculate_column_widths(self, headers: List[str],
                                  rows: List[List[Any]]) -> List[int]:
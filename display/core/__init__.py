@@ -1,13 +1,14 @@
 """Core-Komponenten des Display-Systems."""
 
 from .base_display import BaseDisplay
-from .color_manager import ColorManager
+from .color_manager import ColorManager, NullColorManager
 from .formatter import Formatter
 from .constants import Colors, Layout, Thresholds, Templates
 
 __all__ = [
     "BaseDisplay",
     "ColorManager",
+    "NullColorManager",
     "Formatter",
     "Colors",
     "Layout",
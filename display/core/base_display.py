@@ -5,7 +5,7 @@ Basis-Klasse für alle Display-Komponenten.
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 from .constants import Colors, Layout
-from .color_manager import ColorManager
+from .color_manager import ColorManager, NullColorManager
 from .formatter import Formatter
 
 
@@ -20,7 +20,11 @@ class BaseDisplay(ABC):
             config: Konfigurationsobjekt
         """
         self.config = config
-        self.color_manager = ColorManager(config.display.enable_colors)
+        # Ohne Farben entfallen alle Schwellwert-Prüfungen und ANSI-Wraps
+        if config.display.enable_colors:
+            self.color_manager = ColorManager(True)
+        else:
+            self.color_manager = NullColorManager()
         self.formatter = Formatter(config)
 
     def print_separator(self, char: Optional[str] = None,
@@ -5,6 +5,9 @@ Farb-Management für das Display-System.
 from typing import Optional, Dict, Any, TypedDict
 from .constants import Colors
 
+# Reset-Code als Modul-Konstante (kein Klassen-Attribut-Lookup pro Aufruf)
+_RESET = Colors.RESET
+
 class ColorRule(TypedDict):
     """Type definition für Farbregel"""
     high: float
@@ -113,7 +116,7 @@ class ColorManager:
         if not color_code:
             return text
 
-        return f"{color_code}{text}{Colors.RESET}"
+        return color_code + text + _RESET
 
     def get_threshold_color(self, value: float, threshold_key: str) -> str:
         """
@@ -160,4 +163,33 @@ class ColorManager:
         """Macht Text fett."""
         if not self.enable_colors:
             return text
-        return f"{Colors.BOLD}{text}{Colors.RESET}"
\ No newline at end of file
+        return Colors.BOLD + text + _RESET
+
+
+class NullColorManager(ColorManager):
+    """ColorManager ohne Farben (z.B. für MinimalTheme oder --no-colors)"""
+
+    def __init__(self, enable_colors: bool = False):
+        """
+        Initialisiert den NullColorManager.
+
+        Args:
+            enable_colors: Wird ignoriert, Farben sind immer deaktiviert
+        """
+        super().__init__(False)
+
+    def get_color(self, color: str) -> str:
+        """Gibt immer einen leeren Farbcode zurück."""
+        return ""
+
+    def colorize(self, text: str, color: Optional[str] = None) -> str:
+        """Gibt den Text unverändert zurück."""
+        return text
+
+    def get_threshold_color(self, value: float, threshold_key: str) -> str:
+        """Gibt immer einen leeren Farbcode zurück."""
+        return ""
+
+    def bold(self, text: str) -> str:
+        """Gibt den Text unverändert zurück."""
+        return text
@@ -2,11 +2,28 @@
 Formatierungs-Utilities für das Display-System.
 """
 
+from functools import lru_cache
 from typing import Optional, Any, Union
 from datetime import datetime
 from .constants import Templates
 
 
+@lru_cache(maxsize=64)
+def _format_duration(full_hours: int, minutes: int) -> str:
+    """
+    Formatiert eine Dauer aus Stunden und Minuten (gecacht).
+
+    Die Laufzeit ändert sich nur minütlich, daher ist die Trefferquote
+    über aufeinanderfolgende Anzeigen hoch.
+    """
+    if full_hours == 0:
+        return f"{minutes}m"
+    elif minutes == 0:
+        return f"{full_hours}h"
+    else:
+        return f"{full_hours}h {minutes}m"
+
+
 class Formatter:
     """Formatiert Werte für die Anzeige"""
 
@@ -137,12 +154,7 @@ class Formatter:
         full_hours = int(hours)
         minutes = int((hours - full_hours) * 60)
 
-        if full_hours == 0:
-            return f"{minutes}m"
-        elif minutes == 0:
-            return f"{full_hours}h"
-        else:
-            return f"{full_hours}h {minutes}m"
+        return _format_duration(full_hours, minutes)
 
     def format_timestamp(self, timestamp: Optional[datetime],
                          format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
@@ -1,13 +1,59 @@
 """Solar-Daten Display."""
 
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
 from ..core import BaseDisplay, Colors
 from ..components import Header, Table, ProgressBar, Separator
 
 
+class _SolarSnapshot(NamedTuple):
+    """Einmalig ausgewertete SolarData-Properties für einen Anzeige-Durchlauf"""
+    timestamp: Optional[datetime]
+    pv_power: float
+    load_power: float
+    total_production: float
+    has_battery: bool
+    is_feeding_in: bool
+    feed_in_power: float
+    grid_consumption: float
+    battery_power: float
+    battery_charging: bool
+    battery_charge_power: float
+    battery_discharge_power: float
+    battery_soc: Optional[float]
+    self_consumption: float
+    autarky_rate: float
+    surplus_power: float
+
+    @classmethod
+    def from_data(cls, data: Any) -> '_SolarSnapshot':
+        """Wertet alle benötigten Properties genau einmal aus."""
+        return cls(
+            timestamp=data.timestamp,
+            pv_power=data.pv_power,
+            load_power=data.load_power,
+            total_production=data.total_production,
+            has_battery=data.has_battery,
+            is_feeding_in=data.is_feeding_in,
+            feed_in_power=data.feed_in_power,
+            grid_consumption=data.grid_consumption,
+            battery_power=data.battery_power,
+            battery_charging=data.battery_charging,
+            battery_charge_power=data.battery_charge_power,
+            battery_discharge_power=data.battery_discharge_power,
+            battery_soc=data.battery_soc,
+            self_consumption=data.self_consumption,
+            autarky_rate=data.autarky_rate,
+            surplus_power=data.surplus_power
+        )
+
+
 class SolarDisplay(BaseDisplay):
     """Zeigt Solar-Daten formatiert an"""
 
+    # Mindest-Skala für Leistungs-Progress-Bars (5kW)
+    MIN_POWER_SCALE = 5000
+
     def __init__(self, config: Any):
         """
         Initialisiert SolarDisplay.
@@ -21,6 +67,19 @@ class SolarDisplay(BaseDisplay):
         self.progress = ProgressBar(color_manager=self.color_manager)
         self.separator = Separator()
 
+        # Konfigurationswerte sind nach dem Start fix - einmalig auflösen
+        self._idle_threshold = config.battery.idle_threshold
+        self._surplus_display_threshold = config.display.surplus_display_threshold
+
+        # Feste Abfolge der Abschnitte (Batterie-Abschnitt prüft selbst)
+        self._sections = (
+            self._display_header,
+            self._display_power_section,
+            self._display_grid_section,
+            self._display_battery_section,
+            self._display_calculated_section
+        )
+
     def display(self, data: Any, **kwargs: Any) -> None:
         """
         Zeigt die Solar-Daten an.
@@ -28,23 +87,19 @@ class SolarDisplay(BaseDisplay):
         Args:
             data: SolarData-Objekt
         """
-        self._display_header(data)
-        self._display_power_section(data)
-        self._display_grid_section(data)
+        snap = _SolarSnapshot.from_data(data)
 
-        if data.has_battery:
-            self._display_battery_section(data)
+        for section in self._sections:
+            section(snap)
 
-        self.separator.subsection()
-        self._display_calculated_section(data)
         self.separator.line()
 
-    def _display_header(self, data: Any) -> None:
+    def _display_header(self, data: _SolarSnapshot) -> None:
         """Zeigt den Header mit Zeitstempel."""
         timestamp = data.timestamp.strftime('%Y-%m-%d %H:%M:%S') if data.timestamp else "N/A"
         self.header.display("SOLAR MONITOR", timestamp)
 
-    def _display_power_section(self, data: Any) -> None:
+    def _display_power_section(self, data: _SolarSnapshot) -> None:
         """Zeigt die Leistungswerte."""
         # PV-Erzeugung mit Farbe
         pv_color = self.color_manager.get_threshold_color(data.pv_power, 'pv_power')
@@ -58,7 +113,7 @@ class SolarDisplay(BaseDisplay):
             total_color = self.color_manager.get_threshold_color(data.total_production, 'pv_power')
             self.table.display_colored_row("Gesamtproduktion:", data.total_production, "W", total_color)
 
-    def _display_grid_section(self, data: Any) -> None:
+    def _display_grid_section(self, data: _SolarSnapshot) -> None:
         """Zeigt die Netzwerte."""
         if data.is_feeding_in:
             self.table.display_colored_row("Einspeisung:", data.feed_in_power, "W", Colors.GREEN)
@@ -67,12 +122,15 @@ class SolarDisplay(BaseDisplay):
         else:
             self.table.display_colored_row("Netz:", 0, "W")
 
-    def _display_battery_section(self, data: Any) -> None:
-        """Zeigt Batterie-Informationen."""
+    def _display_battery_section(self, data: _SolarSnapshot) -> None:
+        """Zeigt Batterie-Informationen (nur wenn Batterie vorhanden)."""
+        if not data.has_battery:
+            return
+
         self.separator.empty_line()
 
         # Batterie-Status
-        if abs(data.battery_power) < self.config.battery.idle_threshold:
+        if abs(data.battery_power) < self._idle_threshold:
             status = "Standby"
             power = abs(data.battery_power)
             color = Colors.BLUE
@@ -91,8 +149,10 @@ class SolarDisplay(BaseDisplay):
         if data.battery_soc is not None:
             self.progress.display_battery(data.battery_soc)
 
-    def _display_calculated_section(self, data: Any) -> None:
+    def _display_calculated_section(self, data: _SolarSnapshot) -> None:
         """Zeigt berechnete Werte."""
+        self.separator.subsection()
+
         # Eigenverbrauch und Autarkie
         autarky_color = self.color_manager.get_threshold_color(data.autarky_rate, 'autarky')
 
@@ -100,7 +160,7 @@ class SolarDisplay(BaseDisplay):
         self.table.display_colored_row("Autarkiegrad:", data.autarky_rate, "%", autarky_color)
 
         # Überschuss wenn relevant
-        if data.surplus_power >= self.config.display.surplus_display_threshold:
+        if data.surplus_power >= self._surplus_display_threshold:
             surplus_color = self._get_surplus_color(data.surplus_power)
             self.table.display_colored_row("Verfügbarer Überschuss:", data.surplus_power, "W", surplus_color)
 
@@ -122,10 +182,15 @@ class SolarDisplay(BaseDisplay):
         Args:
             data: SolarData-Objekt
         """
+        data = _SolarSnapshot.from_data(data)
         self._display_header(data)
 
         # Zeige Leistungen als Progress Bars
-        max_power = max(data.pv_power, data.load_power, 5000)  # 5kW minimum
+        pv_power = data.pv_power
+        load_power = data.load_power
+        max_power = pv_power if pv_power > load_power else load_power
+        if max_power < self.MIN_POWER_SCALE:
+            max_power = self.MIN_POWER_SCALE
 
         self.progress.display_power(data.pv_power, max_power, "PV-Erzeugung")
         self.progress.display_power(data.load_power, max_power, "Verbrauch")
@@ -1,119 +1,132 @@
 """Standard-Theme für Display-System."""
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
 from ..core import Colors
 
 
+# Layout-Einstellungen
+_LAYOUT: Mapping[str, Any] = MappingProxyType({
+    'separator_width': 60,
+    'separator_char': '=',
+    'sub_separator_char': '-',
+    'label_width': 25,
+    'value_width': 10,
+    'unit_width': 5,
+    'table_padding': 2,
+    'min_column_width': 8
+})
+
+# Farb-Schema
+_COLORS: Mapping[str, Any] = MappingProxyType({
+    'primary': Colors.BLUE,
+    'success': Colors.GREEN,
+    'warning': Colors.YELLOW,
+    'danger': Colors.RED,
+    'info': Colors.CYAN,
+    'muted': Colors.DIM
+})
+
+# Schwellwerte für Farbcodierung
+_THRESHOLDS: Mapping[str, Any] = MappingProxyType({
+    'battery_soc': MappingProxyType({
+        'high': 80,
+        'medium': 30,
+        'colors': MappingProxyType({
+            'high': Colors.GREEN,
+            'medium': Colors.YELLOW,
+            'low': Colors.RED
+        })
+    }),
+    'autarky': MappingProxyType({
+        'high': 75,
+        'medium': 50,
+        'colors': MappingProxyType({
+            'high': Colors.GREEN,
+            'medium': Colors.YELLOW,
+            'low': Colors.RED
+        })
+    }),
+    'pv_power': MappingProxyType({
+        'high': 3000,
+        'medium': 1000,
+        'colors': MappingProxyType({
+            'high': Colors.GREEN,
+            'medium': Colors.YELLOW,
+            'low': Colors.BLUE
+        })
+    }),
+    'surplus': MappingProxyType({
+        'high': 2000,
+        'medium': 500,
+        'colors': MappingProxyType({
+            'high': Colors.GREEN,
+            'medium': Colors.YELLOW,
+            'low': Colors.BLUE
+        })
+    })
+})
+
+# Zeichen für verschiedene Elemente
+_SYMBOLS: Mapping[str, Any] = MappingProxyType({
+    'arrow_up': '↑',
+    'arrow_down': '↓',
+    'arrow_right': '→',
+    'check': '✓',
+    'cross': '✗',
+    'battery_full': '█',
+    'battery_empty': '░',
+    'progress_full': '█',
+    'progress_empty': '░',
+    'progress_partial': ('▏', '▎', '▍', '▌', '▋', '▊', '▉'),
+    'box_top_left': '┌',
+    'box_top_right': '┐',
+    'box_bottom_left': '└',
+    'box_bottom_right': '┘',
+    'box_horizontal': '─',
+    'box_vertical': '│'
+})
+
+# Format-Templates
+_FORMATS: Mapping[str, Any] = MappingProxyType({
+    'header': "{title:<20} {subtitle}",
+    'value_line': "{label:<{label_width}} {value:>{value_width}} {unit}",
+    'percentage': "{value:>5.1f}%",
+    'power': "{value:>6.0f}W",
+    'energy': "{value:>7.2f} kWh",
+    'currency': "{value:>8.2f} €",
+    'time': "%Y-%m-%d %H:%M:%S",
+    'date': "%d.%m.%Y",
+    'time_short': "%H:%M:%S"
+})
+
+# Anzeige-Optionen
+_DISPLAY_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    'show_progress_bars': True,
+    'show_colors': True,
+    'show_icons': True,
+    'show_borders': True,
+    'show_timestamps': True,
+    'show_units': True,
+    'compact_mode': False
+})
+
+
 class DefaultTheme:
     """Standard-Theme mit vollständiger Funktionalität"""
 
     def __init__(self):
         """Initialisiert das Default Theme."""
-        # Layout-Einstellungen
-        self.layout = {
-            'separator_width': 60,
-            'separator_char': '=',
-            'sub_separator_char': '-',
-            'label_width': 25,
-            'value_width': 10,
-            'unit_width': 5,
-            'table_padding': 2,
-            'min_column_width': 8
-        }
-
-        # Farb-Schema
-        self.colors = {
-            'primary': Colors.BLUE,
-            'success': Colors.GREEN,
-            'warning': Colors.YELLOW,
-            'danger': Colors.RED,
-            'info': Colors.CYAN,
-            'muted': Colors.DIM
-        }
-
-        # Schwellwerte für Farbcodierung
-        self.thresholds = {
-            'battery_soc': {
-                'high': 80,
-                'medium': 30,
-                'colors': {
-                    'high': Colors.GREEN,
-                    'medium': Colors.YELLOW,
-                    'low': Colors.RED
-                }
-            },
-            'autarky': {
-                'high': 75,
-                'medium': 50,
-                'colors': {
-                    'high': Colors.GREEN,
-                    'medium': Colors.YELLOW,
-                    'low': Colors.RED
-                }
-            },
-            'pv_power': {
-                'high': 3000,
-                'medium': 1000,
-                'colors': {
-                    'high': Colors.GREEN,
-                    'medium': Colors.YELLOW,
-                    'low': Colors.BLUE
-                }
-            },
-            'surplus': {
-                'high': 2000,
-                'medium': 500,
-                'colors': {
-                    'high': Colors.GREEN,
-                    'medium': Colors.YELLOW,
-                    'low': Colors.BLUE
-                }
-            }
-        }
-
-        # Zeichen für verschiedene Elemente
-        self.symbols = {
-            'arrow_up': '↑',
-            'arrow_down': '↓',
-            'arrow_right': '→',
-            'check': '✓',
-            'cross': '✗',
-            'battery_full': '█',
-            'battery_empty': '░',
-            'progress_full': '█',
-            'progress_empty': '░',
-            'progress_partial': ['▏', '▎', '▍', '▌', '▋', '▊', '▉'],
-            'box_top_left': '┌',
-            'box_top_right': '┐',
-            'box_bottom_left': '└',
-            'box_bottom_right': '┘',
-            'box_horizontal': '─',
-            'box_vertical': '│'
-        }
-
-        # Format-Templates
-        self.formats = {
-            'header': "{title:<20} {subtitle}",
-            'value_line': "{label:<{label_width}} {value:>{value_width}} {unit}",
-            'percentage': "{value:>5.1f}%",
-            'power': "{value:>6.0f}W",
-            'energy': "{value:>7.2f} kWh",
-            'currency': "{value:>8.2f} €",
-            'time': "%Y-%m-%d %H:%M:%S",
-            'date': "%d.%m.%Y",
-            'time_short': "%H:%M:%S"
-        }
-
-        # Anzeige-Optionen
-        self.display_options = {
-            'show_progress_bars': True,
-            'show_colors': True,
-            'show_icons': True,
-            'show_borders': True,
-            'show_timestamps': True,
-            'show_units': True,
-            'compact_mode': False
-        }
+        # Gemeinsame, unveränderliche Tabellen (keine Kopie pro Instanz)
+        self.layout = _LAYOUT
+        self.colors = _COLORS
+        self.thresholds = _THRESHOLDS
+        self.symbols = _SYMBOLS
+        self.formats = _FORMATS
+        self.display_options = _DISPLAY_OPTIONS
+
+        # Cache für Box-Ränder je Breite
+        self._box_borders: Dict[int, Tuple[str, str]] = {}
 
     def apply_to_config(self, config: Any) -> None:
         """
@@ -178,28 +191,36 @@ class DefaultTheme:
         Returns:
             Liste von Zeilen
         """
-        lines = []
+        top, bottom = self._get_box_borders(width)
+        vertical = self.symbols['box_vertical']
+        inner_width = width - 4
 
-        # Oberer Rand
-        lines.append(
-            self.symbols['box_top_left'] +
-            self.symbols['box_horizontal'] * (width - 2) +
-            self.symbols['box_top_right']
-        )
+        lines = [top]
 
         # Inhalt
-        content_lines = content.split('\n')
-        for line in content_lines:
-            padding = width - len(line) - 4
-            lines.append(
-                f"{self.symbols['box_vertical']} {line}{' ' * padding} {self.symbols['box_vertical']}"
-            )
+        for line in content.split('\n'):
+            lines.append(f"{vertical} {line.ljust(inner_width)} {vertical}")
 
-        # Unterer Rand
-        lines.append(
-            self.symbols['box_bottom_left'] +
-            self.symbols['box_horizontal'] * (width - 2) +
-            self.symbols['box_bottom_right']
-        )
+        lines.append(bottom)
+
+        return lines
+
+    def _get_box_borders(self, width: int) -> Tuple[str, str]:
+        """
+        Gibt oberen und unteren Box-Rand für eine Breite zurück.
 
-        return lines
\ No newline at end of file
+        Args:
+            width: Breite der Box
+
+        Returns:
+            Tuple aus oberem und unterem Rand
+        """
+        borders = self._box_borders.get(width)
+        if borders is None:
+            horizontal = self.symbols['box_horizontal'] * (width - 2)
+            borders = (
+                self.symbols['box_top_left'] + horizontal + self.symbols['box_top_right'],
+                self.symbols['box_bottom_left'] + horizontal + self.symbols['box_bottom_right']
+            )
+            self._box_borders[width] = borders
+        return borders
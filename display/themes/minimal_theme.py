@@ -1,6 +1,114 @@
 """Minimales Theme für Display-System."""
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
+
+
+# Layout-Einstellungen (kompakter)
+_LAYOUT: Mapping[str, Any] = MappingProxyType({
+    'separator_width': 40,
+    'separator_char': '-',
+    'sub_separator_char': '-',
+    'label_width': 20,
+    'value_width': 8,
+    'unit_width': 4,
+    'table_padding': 1,
+    'min_column_width': 6
+})
+
+# Keine Farben
+_COLORS: Mapping[str, Any] = MappingProxyType({
+    'primary': '',
+    'success': '',
+    'warning': '',
+    'danger': '',
+    'info': '',
+    'muted': ''
+})
+
+# Schwellwerte bleiben für Logik
+_THRESHOLDS: Mapping[str, Any] = MappingProxyType({
+    'battery_soc': MappingProxyType({
+        'high': 80,
+        'medium': 30,
+        'colors': MappingProxyType({
+            'high': '',
+            'medium': '',
+            'low': ''
+        })
+    }),
+    'autarky': MappingProxyType({
+        'high': 75,
+        'medium': 50,
+        'colors': MappingProxyType({
+            'high': '',
+            'medium': '',
+            'low': ''
+        })
+    }),
+    'pv_power': MappingProxyType({
+        'high': 3000,
+        'medium': 1000,
+        'colors': MappingProxyType({
+            'high': '',
+            'medium': '',
+            'low': ''
+        })
+    }),
+    'surplus': MappingProxyType({
+        'high': 2000,
+        'medium': 500,
+        'colors': MappingProxyType({
+            'high': '',
+            'medium': '',
+            'low': ''
+        })
+    })
+})
+
+# Einfache ASCII-Zeichen
+_SYMBOLS: Mapping[str, Any] = MappingProxyType({
+    'arrow_up': '^',
+    'arrow_down': 'v',
+    'arrow_right': '>',
+    'check': '[OK]',
+    'cross': '[X]',
+    'battery_full': '#',
+    'battery_empty': '-',
+    'progress_full': '#',
+    'progress_empty': '-',
+    'progress_partial': ('|',),
+    'box_top_left': '+',
+    'box_top_right': '+',
+    'box_bottom_left': '+',
+    'box_bottom_right': '+',
+    'box_horizontal': '-',
+    'box_vertical': '|'
+})
+
+# Vereinfachte Format-Templates
+_FORMATS: Mapping[str, Any] = MappingProxyType({
+    'header': "{title} - {subtitle}",
+    'value_line': "{label:<{label_width}} {value:>{value_width}} {unit}",
+    'percentage': "{value:.0f}%",
+    'power': "{value:.0f}W",
+    'energy': "{value:.1f} kWh",
+    'currency': "{value:.2f} EUR",
+    'time': "%Y-%m-%d %H:%M:%S",
+    'date': "%d.%m.%Y",
+    'time_short': "%H:%M"
+})
+
+# Anzeige-Optionen
+_DISPLAY_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    'show_progress_bars': False,
+    'show_colors': False,
+    'show_icons': False,
+    'show_borders': False,
+    'show_timestamps': True,
+    'show_units': True,
+    'compact_mode': True
+})
 
 
 class MinimalTheme:
@@ -8,111 +116,16 @@ class MinimalTheme:
 
     def __init__(self):
         """Initialisiert das Minimal Theme."""
-        # Layout-Einstellungen (kompakter)
-        self.layout = {
-            'separator_width': 40,
-            'separator_char': '-',
-            'sub_separator_char': '-',
-            'label_width': 20,
-            'value_width': 8,
-            'unit_width': 4,
-            'table_padding': 1,
-            'min_column_width': 6
-        }
-
-        # Keine Farben
-        self.colors = {
-            'primary': '',
-            'success': '',
-            'warning': '',
-            'danger': '',
-            'info': '',
-            'muted': ''
-        }
-
-        # Schwellwerte bleiben für Logik
-        self.thresholds = {
-            'battery_soc': {
-                'high': 80,
-                'medium': 30,
-                'colors': {
-                    'high': '',
-                    'medium': '',
-                    'low': ''
-                }
-            },
-            'autarky': {
-                'high': 75,
-                'medium': 50,
-                'colors': {
-                    'high': '',
-                    'medium': '',
-                    'low': ''
-                }
-            },
-            'pv_power': {
-                'high': 3000,
-                'medium': 1000,
-                'colors': {
-                    'high': '',
-                    'medium': '',
-                    'low': ''
-                }
-            },
-            'surplus': {
-                'high': 2000,
-                'medium': 500,
-                'colors': {
-                    'high': '',
-                    'medium': '',
-                    'low': ''
-                }
-            }
-        }
-
-        # Einfache ASCII-Zeichen
-        self.symbols = {
-            'arrow_up': '^',
-            'arrow_down': 'v',
-            'arrow_right': '>',
-            'check': '[OK]',
-            'cross': '[X]',
-            'battery_full': '#',
-            'battery_empty': '-',
-            'progress_full': '#',
-            'progress_empty': '-',
-            'progress_partial': ['|'],
-            'box_top_left': '+',
-            'box_top_right': '+',
-            'box_bottom_left': '+',
-            'box_bottom_right': '+',
-            'box_horizontal': '-',
-            'box_vertical': '|'
-        }
-
-        # Vereinfachte Format-Templates
-        self.formats = {
-            'header': "{title} - {subtitle}",
-            'value_line': "{label:<{label_width}} {value:>{value_width}} {unit}",
-            'percentage': "{value:.0f}%",
-            'power': "{value:.0f}W",
-            'energy': "{value:.1f} kWh",
-            'currency': "{value:.2f} EUR",
-            'time': "%Y-%m-%d %H:%M:%S",
-            'date': "%d.%m.%Y",
-            'time_short': "%H:%M"
-        }
-
-        # Anzeige-Optionen
-        self.display_options = {
-            'show_progress_bars': False,
-            'show_colors': False,
-            'show_icons': False,
-            'show_borders': False,
-            'show_timestamps': True,
-            'show_units': True,
-            'compact_mode': True
-        }
+        # Gemeinsame, unveränderliche Tabellen (keine Kopie pro Instanz)
+        self.layout = _LAYOUT
+        self.colors = _COLORS
+        self.thresholds = _THRESHOLDS
+        self.symbols = _SYMBOLS
+        self.formats = _FORMATS
+        self.display_options = _DISPLAY_OPTIONS
+
+        # Cache für Box-Trennlinien je Breite
+        self._box_separators: Dict[int, str] = {}
 
     def apply_to_config(self, config: Any) -> None:
         """
@@ -121,7 +134,7 @@ class MinimalTheme:
         Args:
             config: Konfigurationsobjekt
         """
-        # Deaktiviere Farben
+        # Deaktiviere Farben (Displays verwenden dann den NullColorManager)
         config.display.enable_colors = False
 
     def get_color_for_value(self, value: float, metric: str) -> str:
@@ -163,8 +176,12 @@ class MinimalTheme:
         Returns:
             Liste von Zeilen
         """
+        separator = self._box_separators.get(width)
+        if separator is None:
+            separator = '-' * width
+            self._box_separators[width] = separator
+
         lines = []
-        separator = '-' * width
 
         lines.append(separator)
 
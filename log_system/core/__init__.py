@@ -2,11 +2,11 @@
 
 from .interfaces import LogFormatter, LogWriter, LogHandler, FileManager
 from .log_entry import LogEntry, LogType, SolarLogEntry, StatsLogEntry, DeviceEventEntry, DeviceStatusEntry
-from .log_manager import LogManager
+from .log_manager import LogManager, TypeMapping
 
 __all__ = [
     "LogFormatter", "LogWriter", "LogHandler", "FileManager",
     "LogEntry", "LogType", "SolarLogEntry", "StatsLogEntry",
     "DeviceEventEntry", "DeviceStatusEntry",
-    "LogManager"
+    "LogManager", "TypeMapping"
 ]
\ No newline at end of file
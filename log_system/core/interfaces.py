@@ -3,7 +3,7 @@ Abstrakte Interfaces für das Logging-System.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -24,13 +24,28 @@ class LogFormatter(ABC):
         """
         pass
 
+    def format_row(self, data: Any) -> Tuple[Any, ...]:
+        """
+        Formatiert Daten als Zeile in fester Spaltenreihenfolge.
+
+        Standard-Implementierung leitet die Zeile aus format() ab,
+        Formatter mit fester Spaltenfolge überschreiben dies direkt.
+
+        Args:
+            data: Zu formatierende Daten
+
+        Returns:
+            Tupel mit formatierten Werten
+        """
+        return tuple(self.format(data).values())
+
     @abstractmethod
-    def get_headers(self) -> List[str]:
+    def get_headers(self) -> Sequence[str]:
         """
         Gibt die Header für die Ausgabe zurück.
 
         Returns:
-            Liste mit Header-Strings
+            Sequenz mit Header-Strings
         """
         pass
 
@@ -52,6 +67,25 @@ class LogWriter(ABC):
         """
         pass
 
+    def write_many(self, items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> bool:
+        """
+        Schreibt mehrere formatierte Einträge auf einmal.
+
+        Standard-Implementierung ruft write() für jeden Eintrag auf,
+        Writer mit eigenem Batch-Pfad können dies überschreiben.
+
+        Args:
+            items: Liste von (data, metadata)-Tupeln
+
+        Returns:
+            True wenn alle Einträge geschrieben wurden
+        """
+        success = True
+        for data, metadata in items:
+            if not self.write(data, metadata):
+                success = False
+        return success
+
     @abstractmethod
     def write_header(self, headers: List[str], metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -76,6 +110,10 @@ class LogWriter(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Gibt offene Ressourcen frei (Standard: nichts zu tun)."""
+        pass
+
 
 class LogHandler(ABC):
     """Abstrakte Basis für alle Handler"""
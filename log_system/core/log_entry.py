@@ -2,12 +2,46 @@
 Datenmodelle für Log-Einträge.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional, List
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, List
 from enum import Enum
 
 
+# Gemeinsame, unveränderliche Metadaten für Einträge ohne eigene Metadaten
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+# Gecachte String-Darstellung von Gerätezuständen (kleine, feste Menge)
+_STATE_STR: Dict[Any, str] = {}
+
+
+def state_to_str(state: Any) -> str:
+    """
+    Wandelt einen Gerätezustand in seinen String-Wert um.
+
+    Enum-Zustände liefern ihren value, alles andere str(). Das Ergebnis
+    wird je Zustand einmal berechnet und internalisiert.
+
+    Args:
+        state: Zustand (z.B. DeviceState) oder String
+
+    Returns:
+        Zustand als String
+    """
+    try:
+        return _STATE_STR[state]
+    except KeyError:
+        text = sys.intern(state.value if hasattr(state, 'value') else str(state))
+        _STATE_STR[state] = text
+        return text
+    except TypeError:
+        # Nicht hashbarer Zustand
+        return state.value if hasattr(state, 'value') else str(state)
+
+
 class LogType(Enum):
     """Verfügbare Log-Typen"""
     SOLAR = "solar"
@@ -16,85 +50,74 @@ class LogType(Enum):
     DEVICE_STATUS = "device_status"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class LogEntry:
     """Basis-Klasse für alle Log-Einträge"""
     log_type: LogType
     timestamp: datetime = field(default_factory=datetime.now)
     data: Any = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _NO_METADATA)
+
+    @property
+    def payload(self) -> Any:
+        """Daten, die an den Formatter übergeben werden."""
+        return self.data
 
 
-@dataclass
+@dataclass(slots=True)
 class SolarLogEntry(LogEntry):
     """Log-Eintrag für Solar-Daten"""
-
-    def __init__(self, solar_data: Any):
-        super().__init__(
-            log_type=LogType.SOLAR,
-            data=solar_data
-        )
+    data: Any = None
+    log_type: LogType = field(default=LogType.SOLAR, init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class StatsLogEntry(LogEntry):
     """Log-Eintrag für Tagesstatistiken"""
-
-    def __init__(self, daily_stats: Any):
-        super().__init__(
-            log_type=LogType.STATS,
-            data=daily_stats
-        )
+    data: Any = None
+    log_type: LogType = field(default=LogType.STATS, init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceEventEntry(LogEntry):
     """Log-Eintrag für Geräte-Events"""
-    device_name: str = ""
-    action: str = ""
-    old_state: str = ""
-    new_state: str = ""
-    reason: str = ""
-    surplus_power: float = 0.0
-
-    def __init__(self, device: Any, action: str, reason: str,
-                 surplus_power: float, old_state: Any):
-        super().__init__(
-            log_type=LogType.DEVICE_EVENT,
-            data={
-                'device': device,
-                'action': action,
-                'reason': reason,
-                'surplus_power': surplus_power,
-                'old_state': old_state
-            }
-        )
-        self.device_name = device.name
-        self.action = action
-        self.reason = reason
-        self.surplus_power = surplus_power
-        self.old_state = old_state.value if hasattr(old_state, 'value') else str(old_state)
-        self.new_state = device.state.value if hasattr(device.state, 'value') else str(device.state)
-
-
-@dataclass
+    device: Any
+    action: str
+    reason: str
+    surplus_power: float
+    old_state: Any
+    log_type: LogType = field(default=LogType.DEVICE_EVENT, init=False)
+    device_name: str = field(init=False)
+    new_state: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Hält Gerätename und Status zum Zeitpunkt des Events als Strings fest."""
+        self.old_state = state_to_str(self.old_state)
+        self.device_name = self.device.name
+        self.new_state = state_to_str(self.device.state)
+
+    @property
+    def payload(self) -> 'DeviceEventEntry':
+        """Der Eintrag selbst wird formatiert (kein separates Daten-Dict)."""
+        return self
+
+
+@dataclass(slots=True)
 class DeviceStatusEntry(LogEntry):
     """Log-Eintrag für Geräte-Status"""
-    devices: List[Any] = field(default_factory=list)
-    surplus_power: float = 0.0
-    total_consumption: float = 0.0
-
-    def __init__(self, devices: List[Any], surplus_power: float):
-        super().__init__(
-            log_type=LogType.DEVICE_STATUS,
-            data={
-                'devices': devices,
-                'surplus_power': surplus_power
-            }
+    devices: List[Any]
+    surplus_power: float
+    log_type: LogType = field(default=LogType.DEVICE_STATUS, init=False)
+
+    @property
+    def payload(self) -> 'DeviceStatusEntry':
+        """Der Eintrag selbst wird formatiert (kein separates Daten-Dict)."""
+        return self
+
+    @property
+    def total_consumption(self) -> float:
+        """Gesamtverbrauch der eingeschalteten Geräte (nur bei Bedarf berechnet)"""
+        return sum(
+            d.power_consumption for d in self.devices
+            if hasattr(d, 'state') and state_to_str(d.state) == 'on'
         )
-        self.devices = devices
-        self.surplus_power = surplus_power
-        self.total_consumption = sum(
-            d.power_consumption for d in devices
-            if hasattr(d, 'state') and d.state.value == 'on'
-        )
\ No newline at end of file
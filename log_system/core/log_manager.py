@@ -2,10 +2,27 @@
 Zentraler Log-Manager für Koordination.
 """
 
+import atexit
 import logging
-from typing import Dict, List, Any, Optional
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple
 from .interfaces import LogFormatter, LogWriter, LogHandler
-from .log_entry import LogEntry, LogType
+from .log_entry import LogEntry, LogType, state_to_str
+
+
+logger = logging.getLogger(__name__)
+
+
+class TypeMapping(NamedTuple):
+    """Zuordnung eines LogTypes zu Formatter und Writern"""
+    formatter: str
+    writers: Tuple[str, ...]
+
+
+# Signal an den Schreib-Thread zum Beenden
+_STOP = object()
 
 
 class LogManager:
@@ -19,7 +36,6 @@ class LogManager:
             config: Konfigurationsobjekt
         """
         self.config = config
-        self.logger = logging.getLogger(__name__)
 
         # Registries für Komponenten
         self.formatters: Dict[str, LogFormatter] = {}
@@ -27,24 +43,52 @@ class LogManager:
         self.handlers: Dict[str, LogHandler] = {}
 
         # Mapping von LogType zu Komponenten
-        self.type_mapping: Dict[LogType, Dict[str, Any]] = {
-            LogType.SOLAR: {
-                'formatter': 'solar',
-                'writers': ['csv', 'database']
-            },
-            LogType.STATS: {
-                'formatter': 'stats',
-                'writers': ['csv', 'database']
-            },
-            LogType.DEVICE_EVENT: {
-                'formatter': 'device_event',
-                'writers': ['csv', 'database']
-            },
-            LogType.DEVICE_STATUS: {
-                'formatter': 'device_status',
-                'writers': ['csv', 'database']
-            }
+        self.type_mapping: Dict[LogType, TypeMapping] = {
+            LogType.SOLAR: TypeMapping('solar', ('csv', 'database')),
+            LogType.STATS: TypeMapping('stats', ('csv', 'database')),
+            LogType.DEVICE_EVENT: TypeMapping('device_event', ('csv', 'database')),
+            LogType.DEVICE_STATUS: TypeMapping('device_status', ('csv', 'database'))
+        }
+
+        # Aktivierung der Writer je (Writer, LogType) - Config ist zur Laufzeit fix
+        csv_enabled = {
+            LogType.SOLAR: config.logging.enable_data_logging,
+            LogType.STATS: config.logging.enable_daily_stats_logging,
+            LogType.DEVICE_EVENT: config.logging.enable_device_logging,
+            LogType.DEVICE_STATUS: config.logging.enable_device_logging
         }
+        self._writer_enabled: Dict[Tuple[str, LogType], bool] = {}
+        for log_type in LogType:
+            self._writer_enabled[('csv', log_type)] = csv_enabled[log_type]
+            self._writer_enabled[('database', log_type)] = config.database.enable_database
+
+        # Aufgelöste Komponenten je LogType: (Formatter, log_type-Wert, ((Name, Writer), ...))
+        self._resolved: Dict[LogType, Tuple[LogFormatter, str, Tuple[Tuple[str, LogWriter], ...]]] = {}
+
+        # Unterdrückung unveränderter Geräte-Status-Einträge
+        self._dedup_device_status = config.logging.dedup_device_status
+        self._dedup_surplus_step = config.logging.dedup_surplus_step
+        self._last_status_signature: Optional[int] = None
+
+        # Batching: formatierte Einträge je Writer sammeln
+        self._batch_size = config.logging.batch_size
+        self._batch_max_delay = config.logging.batch_max_delay
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+        self._pending_count = 0
+        self._pending_since = time.monotonic()
+
+        # Asynchrones Schreiben: Writer-Aufrufe laufen in einem Hintergrund-Thread
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if config.logging.async_logging:
+            self._queue = queue.Queue(maxsize=config.logging.queue_size)
+            self._worker = threading.Thread(target=self._drain_loop, name="LogWriter", daemon=True)
+            self._worker.start()
+
+        # Ausstehende Einträge auch ohne close_all() beim Beenden schreiben und
+        # Writer erst danach schließen (Writer registrieren keine eigenen Hooks)
+        atexit.register(self.close_all)
+
     def register_formatter(self, name: str, formatter: LogFormatter) -> None:
         """
         Registriert einen Formatter.
@@ -54,7 +98,9 @@ class LogManager:
             formatter: Formatter-Instanz
         """
         self.formatters[name] = formatter
-        self.logger.debug(f"Formatter '{name}' registriert")
+        self._rebuild_resolved()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Formatter '%s' registriert", name)
 
     def register_writer(self, name: str, writer: LogWriter) -> None:
         """
@@ -65,7 +111,9 @@ class LogManager:
             writer: Writer-Instanz
         """
         self.writers[name] = writer
-        self.logger.debug(f"Writer '{name}' registriert")
+        self._rebuild_resolved()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Writer '%s' registriert", name)
 
     def register_handler(self, name: str, handler: LogHandler) -> None:
         """
@@ -76,64 +124,264 @@ class LogManager:
             handler: Handler-Instanz
         """
         self.handlers[name] = handler
-        self.logger.debug(f"Handler '{name}' registriert")
+        self._rebuild_resolved()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Handler '%s' registriert", name)
+
+    def _rebuild_resolved(self) -> None:
+        """
+        Löst Formatter und aktivierte Writer je LogType einmalig auf.
+
+        Wird bei jeder Registrierung aufgerufen, damit log() ohne
+        Dictionary-Lookups und Konfigurationsprüfungen auskommt.
+        """
+        resolved = {}
+        for log_type, mapping in self.type_mapping.items():
+            formatter = self.formatters.get(mapping.formatter)
+            if not formatter:
+                continue
+
+            writer_pairs = tuple(
+                (writer_name, self.writers[writer_name])
+                for writer_name in mapping.writers
+                if writer_name in self.writers and self._is_writer_enabled(writer_name, log_type)
+            )
+            resolved[log_type] = (formatter, log_type.value, writer_pairs)
+
+        self._resolved = resolved
 
     def log(self, entry: LogEntry) -> bool:
         """
         Loggt einen Eintrag.
 
+        Bei batch_size > 1 werden Einträge gesammelt und erst bei vollem
+        Batch oder nach batch_max_delay Sekunden an die Writer übergeben.
+
         Args:
             entry: Log-Eintrag
 
         Returns:
             True bei Erfolg
         """
-        try:
-            # Hole Mapping für diesen LogType
-            mapping = self.type_mapping.get(entry.log_type)
-            if not mapping:
-                self.logger.error(f"Kein Mapping für LogType {entry.log_type}")
-                return False
-
-            # Hole Formatter
-            formatter_name = mapping['formatter']
-            formatter = self.formatters.get(formatter_name)
-            if not formatter:
-                self.logger.error(f"Formatter '{formatter_name}' nicht gefunden")
-                return False
+        if (self._dedup_device_status and entry.log_type is LogType.DEVICE_STATUS
+                and self._is_duplicate_status(entry)):
+            return True
+
+        batched = self._batch_size > 1
+        success = self._dispatch(entry, batched)
+
+        if batched and (self._pending_count >= self._batch_size or
+                        time.monotonic() - self._pending_since >= self._batch_max_delay):
+            success = self._flush_pending() and success
+
+        return success
+
+    def _is_duplicate_status(self, entry: LogEntry) -> bool:
+        """
+        Prüft ob ein Geräte-Status dem zuletzt geloggten entspricht.
+
+        Verglichen werden Zustand und Tageslaufzeit aller Geräte sowie
+        der Überschuss, gerundet auf dedup_surplus_step Watt.
+
+        Args:
+            entry: DeviceStatusEntry
+
+        Returns:
+            True wenn der Eintrag übersprungen werden kann
+        """
+        signature = hash((
+            tuple((d.name, state_to_str(d.state), d.runtime_today)
+                  for d in entry.devices),
+            int(entry.surplus_power // self._dedup_surplus_step)
+        ))
 
-            # Formatiere Daten
-            formatted_data = formatter.format(entry.data)
+        if signature == self._last_status_signature:
+            return True
 
-            # Schreibe mit allen konfigurierten Writers
-            success = True
-            for writer_name in mapping['writers']:
-                writer = self.writers.get(writer_name)
-                if not writer:
-                    self.logger.warning(f"Writer '{writer_name}' nicht gefunden")
-                    continue
+        self._last_status_signature = signature
+        return False
 
-                # Prüfe ob Writer für diesen LogType aktiviert ist
-                if not self._is_writer_enabled(writer_name, entry.log_type):
-                    continue
+    def log_batch(self, entries: List[LogEntry]) -> bool:
+        """
+        Loggt mehrere Einträge und übergibt sie gesammelt an die Writer.
+
+        Args:
+            entries: Liste von Log-Einträgen
 
-                # Schreibe Daten
-                metadata = {
-                    'log_type': entry.log_type.value,
-                    'timestamp': entry.timestamp,
-                    **entry.metadata
-                }
+        Returns:
+            True wenn alle Einträge erfolgreich geloggt wurden
+        """
+        success = True
+        for entry in entries:
+            if not self._dispatch(entry, True):
+                success = False
 
-                if not writer.write(formatted_data, metadata):
-                    self.logger.error(f"Fehler beim Schreiben mit Writer '{writer_name}'")
-                    success = False
+        return self._flush_pending() and success
 
-            return success
+    def _dispatch(self, entry: LogEntry, batched: bool) -> bool:
+        """
+        Formatiert einen Eintrag und übergibt ihn an die Writer.
 
+        Args:
+            entry: Log-Eintrag
+            batched: Ob der Eintrag nur vorgemerkt werden soll
+
+        Returns:
+            True bei Erfolg
+        """
+        resolved = self._resolved.get(entry.log_type)
+        if resolved is None:
+            return self._report_unresolved(entry.log_type)
+
+        formatter, log_type_value, writer_pairs = resolved
+
+        # Formatiere Daten
+        try:
+            formatted_data = formatter.format(entry.payload)
         except Exception as e:
-            self.logger.error(f"Fehler beim Logging: {e}", exc_info=True)
+            logger.error("Fehler beim Formatieren (%s): %s", log_type_value, e, exc_info=True)
             return False
 
+        # Metadaten einmal je Eintrag, von allen Writern nur gelesen
+        metadata = {'log_type': log_type_value, 'timestamp': entry.timestamp}
+        if entry.metadata:
+            metadata.update(entry.metadata)
+
+        # Schreibe mit allen aktivierten Writers
+        success = True
+        for writer_name, writer in writer_pairs:
+            if batched:
+                if not self._pending_count:
+                    self._pending_since = time.monotonic()
+                self._pending.setdefault(writer_name, []).append((formatted_data, metadata))
+                self._pending_count += 1
+            elif not self._submit(self._write, writer_name, writer, formatted_data, metadata):
+                success = False
+
+        return success
+
+    def _submit(self, func: Callable[..., bool], *args: Any) -> bool:
+        """
+        Führt einen Writer-Aufruf aus oder reicht ihn an den Schreib-Thread.
+
+        Bei asynchronem Logging blockiert der Aufruf nur, wenn die Queue
+        voll ist, und meldet immer Erfolg.
+
+        Args:
+            func: Aufzurufende Schreib-Methode
+            *args: Argumente für func
+
+        Returns:
+            True bei Erfolg
+        """
+        if self._queue is None:
+            return func(*args)
+
+        self._queue.put((func, args))
+        return True
+
+    def _drain_loop(self) -> None:
+        """Arbeitet die Schreib-Queue im Hintergrund-Thread ab."""
+        while True:
+            item = self._queue.get()
+
+            if item is _STOP:
+                return
+
+            if isinstance(item, threading.Event):
+                # Flush-Anforderung: alle Aufträge davor sind erledigt
+                self._flush_writers()
+                item.set()
+                continue
+
+            func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error("Fehler im Schreib-Thread: %s", e)
+
+    def _write(self, writer_name: str, writer: LogWriter,
+               data: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
+        """
+        Schreibt einen formatierten Eintrag mit einem Writer.
+
+        Args:
+            writer_name: Name des Writers
+            writer: Writer-Instanz
+            data: Formatierte Daten
+            metadata: Metadaten
+
+        Returns:
+            True bei Erfolg
+        """
+        try:
+            if writer.write(data, metadata):
+                return True
+            logger.error("Fehler beim Schreiben mit Writer '%s'", writer_name)
+        except Exception as e:
+            logger.error("Fehler beim Schreiben mit Writer '%s': %s", writer_name, e)
+        return False
+
+    def _report_unresolved(self, log_type: LogType) -> bool:
+        """
+        Loggt warum für einen LogType keine Komponenten aufgelöst sind.
+
+        Args:
+            log_type: Typ des Logs
+
+        Returns:
+            Immer False
+        """
+        mapping = self.type_mapping.get(log_type)
+        if not mapping:
+            logger.error("Kein Mapping für LogType %s", log_type)
+        else:
+            logger.error("Formatter '%s' nicht gefunden", mapping.formatter)
+        return False
+
+    def _flush_pending(self) -> bool:
+        """
+        Übergibt alle gesammelten Einträge an die Writer.
+
+        Returns:
+            True bei Erfolg
+        """
+        if not self._pending_count:
+            return True
+
+        pending = self._pending
+        self._pending = {}
+        self._pending_count = 0
+
+        success = True
+        for writer_name, items in pending.items():
+            writer = self.writers.get(writer_name)
+            if writer and not self._submit(self._write_many, writer_name, writer, items):
+                success = False
+
+        return success
+
+    def _write_many(self, writer_name: str, writer: LogWriter,
+                    items: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> bool:
+        """
+        Schreibt mehrere formatierte Einträge mit einem Writer.
+
+        Args:
+            writer_name: Name des Writers
+            writer: Writer-Instanz
+            items: Liste von (data, metadata)-Tupeln
+
+        Returns:
+            True bei Erfolg
+        """
+        try:
+            if writer.write_many(items):
+                return True
+            logger.error("Fehler beim Schreiben mit Writer '%s'", writer_name)
+        except Exception as e:
+            logger.error("Fehler beim Batch-Schreiben mit Writer '%s': %s", writer_name, e)
+        return False
+
     def _is_writer_enabled(self, writer_name: str, log_type: LogType) -> bool:
         """
         Prüft ob ein Writer für einen LogType aktiviert ist.
@@ -145,39 +393,78 @@ class LogManager:
         Returns:
             True wenn aktiviert
         """
-        # CSV-Writer Checks
-        if writer_name == 'csv':
-            if log_type == LogType.SOLAR:
-                return self.config.logging.enable_data_logging
-            elif log_type == LogType.STATS:
-                return self.config.logging.enable_daily_stats_logging
-            elif log_type in [LogType.DEVICE_EVENT, LogType.DEVICE_STATUS]:
-                return self.config.logging.enable_device_logging
-
-        # Database-Writer Check
-        elif writer_name == 'database':
-            return self.config.database.enable_database
-
-        return True
+        return self._writer_enabled.get((writer_name, log_type), True)
 
     def flush_all(self) -> None:
         """Leert alle Writer-Buffer."""
+        # Erst gesammelte Einträge an die Writer übergeben
+        self._flush_pending()
+
+        if self._worker is not None and self._worker.is_alive():
+            # Flush im Schreib-Thread, nachdem alle Aufträge davor erledigt sind
+            done = threading.Event()
+            self._queue.put(done)
+            if not done.wait(timeout=10):
+                logger.warning("Timeout beim Flush des Schreib-Threads")
+            return
+
+        self._flush_writers()
+
+    def _flush_writers(self) -> None:
+        """Ruft flush() auf allen Writern auf."""
         for name, writer in self.writers.items():
             try:
                 writer.flush()
             except Exception as e:
-                self.logger.error(f"Fehler beim Flush von Writer '{name}': {e}")
+                logger.error("Fehler beim Flush von Writer '%s': %s", name, e)
+
+    def _stop_worker(self) -> bool:
+        """
+        Beendet den Schreib-Thread, nachdem alle Aufträge erledigt sind.
+
+        Returns:
+            True wenn kein Schreib-Thread mehr auf die Writer zugreift
+        """
+        worker = self._worker
+        if worker is None:
+            return True
+
+        self._flush_pending()
+        self._queue.put(_STOP)
+        worker.join(timeout=10)
+        if worker.is_alive():
+            # Writer gehören weiterhin dem Schreib-Thread - nicht parallel benutzen
+            logger.warning("Schreib-Thread konnte nicht rechtzeitig beendet werden")
+            return False
+
+        self._worker = None
+        self._queue = None
+
+        # Restliche Writer-Buffer im aufrufenden Thread leeren
+        self._flush_writers()
+        return True
 
     def close_all(self) -> None:
         """Schließt alle Handler und Writer."""
+        atexit.unregister(self.close_all)
+
         # Erst alle Writer flushen
         self.flush_all()
 
+        # Schreib-Thread beenden, Writer nur schließen wenn er beendet ist
+        if self._stop_worker():
+            # Writer schließen (z.B. offene Dateien)
+            for name, writer in self.writers.items():
+                try:
+                    writer.close()
+                except Exception as e:
+                    logger.error("Fehler beim Schließen von Writer '%s': %s", name, e)
+
         # Dann Handler schließen
         for name, handler in self.handlers.items():
             try:
                 handler.close()
             except Exception as e:
-                self.logger.error(f"Fehler beim Schließen von Handler '{name}': {e}")
+                logger.error("Fehler beim Schließen von Handler '%s': %s", name, e)
 
-        self.logger.info("LogManager geschlossen")
\ No newline at end of file
+        logger.info("LogManager geschlossen")
\ No newline at end of file
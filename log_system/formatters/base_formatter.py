@@ -2,7 +2,7 @@
 Basis-Formatter für das Logging-System.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from ..core.interfaces import LogFormatter
 
@@ -10,6 +10,9 @@ from ..core.interfaces import LogFormatter
 class BaseFormatter(LogFormatter):
     """Basis-Implementierung für alle Formatter"""
 
+    # Feldnamen in Spaltenreihenfolge von format_row()
+    FIELDS: Tuple[str, ...] = ()
+
     def __init__(self, config: Any):
         """
         Initialisiert den Formatter.
@@ -20,6 +23,26 @@ class BaseFormatter(LogFormatter):
         self.config = config
         self.decimal_separator = config.csv.decimal_separator
         self.use_german_headers = config.csv.use_german_headers
+        self._comma_decimal = self.decimal_separator == ","
+
+        # Vorbereitete Format-Funktionen je (Nachkommastellen, Vorzeichen)
+        self._number_formats: Dict[Tuple[int, bool], Callable[[float], str]] = {
+            (decimals, with_sign): f"{{:{'+' if with_sign else ''}.{decimals}f}}".format
+            for decimals in (0, 1, 2)
+            for with_sign in (False, True)
+        }
+
+    def format(self, data: Any) -> Dict[str, Any]:
+        """
+        Formatiert Daten als Dictionary (Feldname -> Wert).
+
+        Args:
+            data: Zu formatierende Daten
+
+        Returns:
+            Dictionary mit formatierten Daten
+        """
+        return dict(zip(self.FIELDS, self.format_row(data)))
 
     def format_number(self, value: Optional[float], decimals: int = 0,
                       with_sign: bool = False) -> str:
@@ -38,13 +61,15 @@ class BaseFormatter(LogFormatter):
             return "-"
 
         try:
-            if decimals == 0:
-                formatted = f"{value:+.0f}" if with_sign else f"{value:.0f}"
-            else:
-                formatted = f"{value:+.{decimals}f}" if with_sign else f"{value:.{decimals}f}"
+            number_format = self._number_formats.get((decimals, with_sign))
+            if number_format is None:
+                number_format = f"{{:{'+' if with_sign else ''}.{decimals}f}}".format
+                self._number_formats[(decimals, with_sign)] = number_format
+
+            formatted = number_format(value)
 
-            # Dezimaltrennzeichen anpassen
-            if self.decimal_separator == ",":
+            # Dezimaltrennzeichen anpassen (ohne Nachkommastellen kein Punkt)
+            if decimals and self._comma_decimal:
                 formatted = formatted.replace(".", ",")
 
             return formatted
@@ -2,114 +2,161 @@
 Formatter für Geräte-Daten.
 """
 
-from typing import Any, Dict, List
-from datetime import datetime
+from typing import Any, Dict, List, Tuple
 from .base_formatter import BaseFormatter
+from ..core.log_entry import state_to_str
 
 
 class DeviceEventFormatter(BaseFormatter):
     """Formatter für Geräte-Events"""
 
-    def format(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    FIELDS = (
+        'timestamp', 'device_name', 'action', 'from_state', 'to_state',
+        'reason', 'surplus_power', 'device_power', 'on_threshold',
+        'off_threshold', 'runtime_today', 'priority'
+    )
+
+    # CSV-Header (deutsch/englisch)
+    HEADERS_DE = (
+        "Zeitstempel",
+        "Gerät",
+        "Aktion",
+        "Von Status",
+        "Zu Status",
+        "Grund",
+        "Überschuss (W)",
+        "Geräteverbrauch (W)",
+        "Schwellwert Ein (W)",
+        "Schwellwert Aus (W)",
+        "Laufzeit heute (min)",
+        "Priorität"
+    )
+    HEADERS_EN = (
+        "Timestamp",
+        "Device",
+        "Action",
+        "From State",
+        "To State",
+        "Reason",
+        "Surplus (W)",
+        "Device Power (W)",
+        "On Threshold (W)",
+        "Off Threshold (W)",
+        "Runtime Today (min)",
+        "Priority"
+    )
+
+    def __init__(self, config: Any):
         """
-        Formatiert Device-Event für Output.
+        Initialisiert den Formatter.
 
         Args:
-            data: Dictionary mit Event-Daten
+            config: Konfigurationsobjekt
+        """
+        super().__init__(config)
+        self._headers = self.HEADERS_DE if self.use_german_headers else self.HEADERS_EN
 
-        Returns:
-            Dictionary mit formatierten Daten
+    def format_row(self, data: Any) -> Tuple[str, ...]:
         """
-        device = data['device']
-        return {
-            'timestamp': self.format_timestamp(datetime.now()),
-            'device_name': device.name,
-            'action': data['action'],
-            'from_state': data['old_state'].value if hasattr(data['old_state'], 'value') else str(data['old_state']),
-            'to_state': device.state.value if hasattr(device.state, 'value') else str(device.state),
-            'reason': data['reason'],
-            'surplus_power': self.format_number(data['surplus_power']),
-            'device_power': self.format_number(device.power_consumption),
-            'on_threshold': self.format_number(device.switch_on_threshold),
-            'off_threshold': self.format_number(device.switch_off_threshold),
-            'runtime_today': self.format_number(device.runtime_today),
-            'priority': str(device.priority.value if hasattr(device.priority, 'value') else device.priority)
-        }
+        Formatiert Device-Event als Zeile in Reihenfolge von FIELDS.
 
-    def get_headers(self) -> List[str]:
+        Args:
+            data: DeviceEventEntry
+
+        Returns:
+            Tupel mit formatierten Werten
+        """
+        device = data.device
+        return (
+            self.format_timestamp(data.timestamp),
+            device.name,
+            data.action,
+            data.old_state,
+            data.new_state,
+            data.reason,
+            self.format_number(data.surplus_power),
+            self.format_number(device.power_consumption),
+            self.format_number(device.switch_on_threshold),
+            self.format_number(device.switch_off_threshold),
+            self.format_number(device.runtime_today),
+            str(device.priority.value if hasattr(device.priority, 'value') else device.priority)
+        )
+
+    def get_headers(self) -> Tuple[str, ...]:
         """
         Gibt die CSV-Header zurück.
 
         Returns:
-            Liste mit Header-Spalten
+            Tupel mit Header-Spalten
         """
-        if self.use_german_headers:
-            return [
-                "Zeitstempel",
-                "Gerät",
-                "Aktion",
-                "Von Status",
-                "Zu Status",
-                "Grund",
-                "Überschuss (W)",
-                "Geräteverbrauch (W)",
-                "Schwellwert Ein (W)",
-                "Schwellwert Aus (W)",
-                "Laufzeit heute (min)",
-                "Priorität"
-            ]
-        else:
-            return [
-                "Timestamp",
-                "Device",
-                "Action",
-                "From State",
-                "To State",
-                "Reason",
-                "Surplus (W)",
-                "Device Power (W)",
-                "On Threshold (W)",
-                "Off Threshold (W)",
-                "Runtime Today (min)",
-                "Priority"
-            ]
+        return self._headers
 
 
 class DeviceStatusFormatter(BaseFormatter):
     """Formatter für Geräte-Status"""
 
-    def format(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(self, config: Any):
+        """
+        Initialisiert den Formatter.
+
+        Args:
+            config: Konfigurationsobjekt
+        """
+        super().__init__(config)
+
+        # Spaltennamen je Gerätename (state, runtime)
+        self._device_keys: Dict[str, Tuple[str, str]] = {}
+
+    def _get_device_keys(self, name: str) -> Tuple[str, str]:
+        """
+        Gibt die Spaltennamen für ein Gerät zurück.
+
+        Args:
+            name: Gerätename
+
+        Returns:
+            Tupel (Status-Spalte, Laufzeit-Spalte)
+        """
+        keys = self._device_keys.get(name)
+        if keys is None:
+            device_key = name.lower().replace(' ', '_')
+            keys = (f'{device_key}_state', f'{device_key}_runtime')
+            self._device_keys[name] = keys
+        return keys
+
+    def format(self, data: Any) -> Dict[str, Any]:
         """
         Formatiert Device-Status für Output.
 
         Args:
-            data: Dictionary mit Status-Daten
+            data: DeviceStatusEntry
 
         Returns:
             Dictionary mit formatierten Daten
         """
-        devices = data['devices']
-        surplus_power = data['surplus_power']
+        devices = data.devices
+        surplus_power = data.surplus_power
 
         # Basis-Daten
         result = {
-            'timestamp': self.format_timestamp(datetime.now())
+            'timestamp': self.format_timestamp(data.timestamp)
         }
 
         # Daten für jedes Gerät
-        total_on = 0
-        total_consumption = 0.0
+        on_devices = []
 
         for device in devices:
-            is_on = device.state.value == 'on' if hasattr(device.state, 'value') else False
-            device_key = device.name.lower().replace(' ', '_')
+            is_on = state_to_str(device.state) == 'on'
+            state_key, runtime_key = self._get_device_keys(device.name)
 
-            result[f'{device_key}_state'] = self.format_boolean(is_on)
-            result[f'{device_key}_runtime'] = self.format_number(device.runtime_today)
+            result[state_key] = self.format_boolean(is_on)
+            result[runtime_key] = self.format_number(device.runtime_today)
 
             if is_on:
-                total_on += 1
-                total_consumption += device.power_consumption
+                on_devices.append(device)
+
+        total_on = len(on_devices)
+        total_consumption = sum((device.power_consumption for device in on_devices), 0.0)
 
         # Zusammenfassung
         used_surplus = min(total_consumption, max(0, surplus_power))
@@ -2,113 +2,145 @@
 Formatter für Tagesstatistiken.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Tuple
+from operator import attrgetter
 from .base_formatter import BaseFormatter
 
 
+# Numerische Spalten nach 'date' in FIELDS-Reihenfolge: (Attribut, Nachkommastellen)
+_NUMBER_COLUMNS = (
+    ('runtime_hours', 1),
+    ('pv_energy', 2),
+    ('consumption_energy', 2),
+    ('self_consumption_energy', 2),
+    ('feed_in_energy', 2),
+    ('grid_energy', 2),
+    ('grid_energy_day', 2),
+    ('grid_energy_night', 2),
+    ('battery_charge_energy', 2),
+    ('battery_discharge_energy', 2),
+    ('pv_power_max', 0),
+    ('consumption_power_max', 0),
+    ('feed_in_power_max', 0),
+    ('grid_power_max', 0),
+    ('surplus_power_max', 0),
+    ('battery_soc_min', 1),
+    ('battery_soc_max', 1),
+    ('autarky_avg', 1),
+    ('self_sufficiency_rate', 1),
+    ('cost_grid_consumption', 2),
+    ('revenue_feed_in', 2),
+    ('cost_saved', 2),
+    ('total_benefit', 2),
+    ('cost_without_solar', 2)
+)
+
+
 class StatsFormatter(BaseFormatter):
     """Formatter für Tagesstatistik-Daten"""
 
-    def format(self, data: Any) -> Dict[str, Any]:
+    FIELDS = (
+        'date', 'runtime_hours', 'pv_energy', 'consumption_energy',
+        'self_consumption_energy', 'feed_in_energy', 'grid_energy',
+        'grid_energy_day', 'grid_energy_night', 'battery_charge_energy',
+        'battery_discharge_energy', 'pv_power_max', 'consumption_power_max',
+        'feed_in_power_max', 'grid_power_max', 'surplus_power_max',
+        'battery_soc_min', 'battery_soc_max', 'autarky_avg',
+        'self_sufficiency_rate', 'cost_grid_consumption', 'revenue_feed_in',
+        'cost_saved', 'total_benefit', 'cost_without_solar'
+    )
+
+    # CSV-Header (deutsch/englisch)
+    HEADERS_DE = (
+        "Datum",
+        "Laufzeit (h)",
+        "PV-Produktion (kWh)",
+        "Verbrauch (kWh)",
+        "Eigenverbrauch (kWh)",
+        "Einspeisung (kWh)",
+        "Netzbezug (kWh)",
+        "Netzbezug Tag (kWh)",
+        "Netzbezug Nacht (kWh)",
+        "Batterie geladen (kWh)",
+        "Batterie entladen (kWh)",
+        "Max PV-Leistung (W)",
+        "Max Verbrauch (W)",
+        "Max Einspeisung (W)",
+        "Max Netzbezug (W)",
+        "Max Überschuss (W)",
+        "Min Batterie SOC (%)",
+        "Max Batterie SOC (%)",
+        "Ø Autarkie (%)",
+        "Energie-Autarkie (%)",
+        "Stromkosten (EUR)",
+        "Einspeisevergütung (EUR)",
+        "Eingesparte Kosten (EUR)",
+        "Gesamtnutzen (EUR)",
+        "Kosten ohne Solar (EUR)"
+    )
+    HEADERS_EN = (
+        "Date",
+        "Runtime (h)",
+        "PV Production (kWh)",
+        "Consumption (kWh)",
+        "Self Consumption (kWh)",
+        "Feed-in (kWh)",
+        "Grid Consumption (kWh)",
+        "Grid Day (kWh)",
+        "Grid Night (kWh)",
+        "Battery Charged (kWh)",
+        "Battery Discharged (kWh)",
+        "Max PV Power (W)",
+        "Max Consumption (W)",
+        "Max Feed-in (W)",
+        "Max Grid Power (W)",
+        "Max Surplus (W)",
+        "Min Battery SOC (%)",
+        "Max Battery SOC (%)",
+        "Avg Autarky (%)",
+        "Energy Autarky (%)",
+        "Electricity Cost (EUR)",
+        "Feed-in Revenue (EUR)",
+        "Saved Cost (EUR)",
+        "Total Benefit (EUR)",
+        "Cost without Solar (EUR)"
+    )
+
+    def __init__(self, config: Any):
+        """
+        Initialisiert den Formatter.
+
+        Args:
+            config: Konfigurationsobjekt
+        """
+        super().__init__(config)
+        self._headers = self.HEADERS_DE if self.use_german_headers else self.HEADERS_EN
+
+        # Alle Zahlenwerte mit einem Aufruf lesen
+        self._get_numbers = attrgetter(*(name for name, _ in _NUMBER_COLUMNS))
+        self._decimals = tuple(decimals for _, decimals in _NUMBER_COLUMNS)
+
+    def format_row(self, data: Any) -> Tuple[str, ...]:
         """
-        Formatiert DailyStats für Output.
+        Formatiert DailyStats als Zeile in Reihenfolge von FIELDS.
 
         Args:
             data: DailyStats-Objekt
 
         Returns:
-            Dictionary mit formatierten Daten
+            Tupel mit formatierten Werten
         """
-        return {
-            'date': data.date.strftime('%Y-%m-%d'),
-            'runtime_hours': self.format_number(data.runtime_hours, decimals=1),
-            'pv_energy': self.format_number(data.pv_energy, decimals=2),
-            'consumption_energy': self.format_number(data.consumption_energy, decimals=2),
-            'self_consumption_energy': self.format_number(data.self_consumption_energy, decimals=2),
-            'feed_in_energy': self.format_number(data.feed_in_energy, decimals=2),
-            'grid_energy': self.format_number(data.grid_energy, decimals=2),
-            'grid_energy_day': self.format_number(data.grid_energy_day, decimals=2),
-            'grid_energy_night': self.format_number(data.grid_energy_night, decimals=2),
-            'battery_charge_energy': self.format_number(data.battery_charge_energy, decimals=2),
-            'battery_discharge_energy': self.format_number(data.battery_discharge_energy, decimals=2),
-            'pv_power_max': self.format_number(data.pv_power_max),
-            'consumption_power_max': self.format_number(data.consumption_power_max),
-            'feed_in_power_max': self.format_number(data.feed_in_power_max),
-            'grid_power_max': self.format_number(data.grid_power_max),
-            'surplus_power_max': self.format_number(data.surplus_power_max),
-            'battery_soc_min': self.format_number(data.battery_soc_min, decimals=1)
-            if data.battery_soc_min is not None else "-",
-            'battery_soc_max': self.format_number(data.battery_soc_max, decimals=1)
-            if data.battery_soc_max is not None else "-",
-            'autarky_avg': self.format_number(data.autarky_avg, decimals=1),
-            'self_sufficiency_rate': self.format_number(data.self_sufficiency_rate, decimals=1),
-            'cost_grid_consumption': self.format_number(data.cost_grid_consumption, decimals=2),
-            'revenue_feed_in': self.format_number(data.revenue_feed_in, decimals=2),
-            'cost_saved': self.format_number(data.cost_saved, decimals=2),
-            'total_benefit': self.format_number(data.total_benefit, decimals=2),
-            'cost_without_solar': self.format_number(data.cost_without_solar, decimals=2)
-        }
+        numbers = self._get_numbers(data)
+        return (
+            data.date.strftime('%Y-%m-%d'),
+            *map(self.format_number, numbers, self._decimals)
+        )
 
-    def get_headers(self) -> List[str]:
+    def get_headers(self) -> Tuple[str, ...]:
         """
         Gibt die CSV-Header zurück.
 
         Returns:
-            Liste mit Header-Spalten
+            Tupel mit Header-Spalten
         """
-        if self.use_german_headers:
-            return [
-                "Datum",
-                "Laufzeit (h)",
-                "PV-Produktion (kWh)",
-                "Verbrauch (kWh)",
-                "Eigenverbrauch (kWh)",
-                "Einspeisung (kWh)",
-                "Netzbezug (kWh)",
-                "Netzbezug Tag (kWh)",
-                "Netzbezug Nacht (kWh)",
-                "Batterie geladen (kWh)",
-                "Batterie entladen (kWh)",
-                "Max PV-Leistung (W)",
-                "Max Verbrauch (W)",
-                "Max Einspeisung (W)",
-                "Max Netzbezug (W)",
-                "Max Überschuss (W)",
-                "Min Batterie SOC (%)",
-                "Max Batterie SOC (%)",
-                "Ø Autarkie (%)",
-                "Energie-Autarkie (%)",
-                "Stromkosten (EUR)",
-                "Einspeisevergütung (EUR)",
-                "Eingesparte Kosten (EUR)",
-                "Gesamtnutzen (EUR)",
-                "Kosten ohne Solar (EUR)"
-            ]
-        else:
-            return [
-                "Date",
-                "Runtime (h)",
-                "PV Production (kWh)",
-                "Consumption (kWh)",
-                "Self Consumption (kWh)",
-                "Feed-in (kWh)",
-                "Grid Consumption (kWh)",
-                "Grid Day (kWh)",
-                "Grid Night (kWh)",
-                "Battery Charged (kWh)",
-                "Battery Discharged (kWh)",
-                "Max PV Power (W)",
-                "Max Consumption (W)",
-                "Max Feed-in (W)",
-                "Max Grid Power (W)",
-                "Max Surplus (W)",
-                "Min Battery SOC (%)",
-                "Max Battery SOC (%)",
-                "Avg Autarky (%)",
-                "Energy Autarky (%)",
-                "Electricity Cost (EUR)",
-                "Feed-in Revenue (EUR)",
-                "Saved Cost (EUR)",
-                "Total Benefit (EUR)",
-                "Cost without Solar (EUR)"
-            ]
\ No newline at end of file
+        return self._headers
\ No newline at end of file
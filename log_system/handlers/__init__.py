@@ -1,7 +1,8 @@
 """Handler für File-Management und andere Aufgaben."""
 
-from .file_handler import FileHandler
+from .file_handler import FileHandler, FileConfig
 
 __all__ = [
-    "FileHandler"
+    "FileHandler",
+    "FileConfig"
 ]
\ No newline at end of file
@@ -3,12 +3,24 @@ File Handler für das Logging-System.
 """
 
 import logging
+import math
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, NamedTuple, Set, Tuple
 from ..core.interfaces import FileManager
 
 
+logger = logging.getLogger(__name__)
+
+
+class FileConfig(NamedTuple):
+    """Datei-Konfiguration eines Log-Typs"""
+    sub_dir: str
+    base_name: str
+    session_based: bool
+
+
 class FileHandler(FileManager):
     """Verwaltet Dateipfade ohne Rotation"""
 
@@ -20,37 +32,54 @@ class FileHandler(FileManager):
             config: Konfigurationsobjekt
         """
         self.config = config
-        self.logger = logging.getLogger(__name__)
 
         # Basis-Verzeichnisse
         self.base_dir = Path(config.directories.data_log_dir)
 
         # Mapping von log_type zu Konfiguration
-        self.type_config = {
-            'solar': {
-                'sub_dir': config.directories.solar_data_dir,
-                'base_name': config.directories.data_log_base_name,
-                'session_based': False
-            },
-            'stats': {
-                'sub_dir': config.directories.daily_stats_dir,
-                'base_name': config.directories.daily_stats_base_name,
-                'session_based': False
-            },
-            'device_event': {
-                'sub_dir': config.directories.device_log_dir,
-                'base_name': config.directories.device_events_base_name,
-                'session_based': False
-            },
-            'device_status': {
-                'sub_dir': config.directories.device_log_dir,
-                'base_name': config.directories.device_status_base_name,
-                'session_based': False
-            }
+        self.type_config: Dict[str, FileConfig] = {
+            'solar': FileConfig(
+                sub_dir=config.directories.solar_data_dir,
+                base_name=config.directories.data_log_base_name,
+                session_based=False
+            ),
+            'stats': FileConfig(
+                sub_dir=config.directories.daily_stats_dir,
+                base_name=config.directories.daily_stats_base_name,
+                session_based=False
+            ),
+            'device_event': FileConfig(
+                sub_dir=config.directories.device_log_dir,
+                base_name=config.directories.device_events_base_name,
+                session_based=False
+            ),
+            'device_status': FileConfig(
+                sub_dir=config.directories.device_log_dir,
+                base_name=config.directories.device_status_base_name,
+                session_based=False
+            )
+        }
+
+        # Verzeichnisse je log_type einmalig auflösen
+        self._log_dirs: Dict[str, Path] = {
+            log_type: self.base_dir / file_config.sub_dir
+            for log_type, file_config in self.type_config.items()
+        }
+
+        # Dateinamen-Präfix je log_type (base_name ohne ".csv")
+        self._base_names: Dict[str, str] = {
+            log_type: file_config.base_name.replace('.csv', '')
+            for log_type, file_config in self.type_config.items()
         }
 
-        # Cache für aktuelle Pfade
-        self._current_paths: Dict[str, Path] = {}
+        # Cache für aktuelle Pfade: log_type -> (gültig bis Epoch-Sekunde, Pfad)
+        self._current_paths: Dict[str, Tuple[float, Path]] = {}
+
+        # Verzeichnisse, die bereits angelegt wurden
+        self._created_dirs: Set[Path] = set()
+
+        # Zuletzt formatiertes Datum: (gültig bis Epoch-Sekunde, "YYYYMMDD")
+        self._date_cache: Tuple[float, str] = (0.0, "")
 
         # Session-Zeitstempel für session-basierte Dateien
         self._session_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -65,36 +94,69 @@ class FileHandler(FileManager):
         Returns:
             Pfad zur Log-Datei
         """
-        # Prüfe Cache
-        if log_type in self._current_paths:
-            return self._current_paths[log_type]
+        # Schneller Pfad: gültiger Cache-Eintrag (bis Mitternacht bzw. Programmende)
+        cached = self._current_paths.get(log_type)
+        if cached is not None and time.time() < cached[0]:
+            return cached[1]
+
+        return self._resolve_path(log_type)
 
-        # Generiere neuen Pfad
+    def _resolve_path(self, log_type: str) -> Path:
+        """
+        Bestimmt den Pfad für einen Log-Typ neu und legt ihn im Cache ab.
+
+        Args:
+            log_type: Typ des Logs
+
+        Returns:
+            Pfad zur Log-Datei
+        """
         config = self.type_config.get(log_type)
         if not config:
             raise ValueError(f"Unbekannter log_type: {log_type}")
 
+        # Session-basiert: Ein Mal pro Programmlauf, sonst eine Datei pro Tag
+        if config.session_based:
+            period = self._session_timestamp
+            valid_until = math.inf
+        else:
+            period = self._get_date_str()
+            valid_until = self._date_cache[0]
+
         # Verzeichnis
-        log_dir = self.base_dir / config['sub_dir']
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = self._log_dirs[log_type]
+        if log_dir not in self._created_dirs:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(log_dir)
 
         # Dateiname
-        base_name = config['base_name'].replace('.csv', '')
+        path = log_dir / f"{self._base_names[log_type]}_{period}.csv"
 
-        if config['session_based']:
-            # Session-basiert: Ein Mal pro Programmlauf
-            filename = f"{base_name}_{self._session_timestamp}.csv"
-        else:
-            # Tagesbasiert: Eine Datei pro Tag
-            date_str = datetime.now().strftime("%Y%m%d")
-            filename = f"{base_name}_{date_str}.csv"
+        self._current_paths[log_type] = (valid_until, path)
+        return path
 
-        path = log_dir / filename
+    def _get_date_str(self) -> str:
+        """
+        Gibt das aktuelle Datum als "YYYYMMDD" zurück.
 
-        # Cache aktualisieren
-        self._current_paths[log_type] = path
+        Der String wird bis Mitternacht (lokale Zeit) zwischengespeichert.
 
-        return path
+        Returns:
+            Formatiertes Datum
+        """
+        now = time.time()
+        valid_until, date_str = self._date_cache
+        if now < valid_until:
+            return date_str
+
+        local = time.localtime(now)
+        date_str = time.strftime("%Y%m%d", local)
+
+        # Beginn des nächsten Tages (mktime normalisiert tm_mday + 1)
+        next_midnight = time.mktime((local.tm_year, local.tm_mon, local.tm_mday + 1,
+                                     0, 0, 0, 0, 0, -1))
+        self._date_cache = (next_midnight, date_str)
+        return date_str
 
     def should_rotate(self, log_type: str) -> bool:
         """
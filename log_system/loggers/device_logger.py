@@ -3,12 +3,56 @@ Device Logger - Orchestriert das Logging von Geräte-Daten.
 """
 
 import logging
+from functools import lru_cache
 from typing import Any, List, Dict
 from datetime import datetime
+from device_management import DeviceState
 from ..core.log_manager import LogManager
 from ..core.log_entry import DeviceEventEntry, DeviceStatusEntry
 
 
+logger = logging.getLogger(__name__)
+
+
+# Kopfzeilen der Tageszusammenfassung
+_SUMMARY_TITLE = "Geräte-Tageszusammenfassung - {}\n"
+_SUMMARY_RULE = "=" * 60 + "\n\n"
+
+# Feste Gründe je Aktions-Klasse (Schwellwert-Gründe werden pro Gerät formatiert)
+_FIXED_REASONS = {
+    'off_time': "Außerhalb erlaubter Zeit",
+    'off_max': "Maximale Tageslaufzeit erreicht",
+    'off_other': "Manuell/System"
+}
+
+
+@lru_cache(maxsize=64)
+def _classify_action(action: str) -> str:
+    """
+    Ordnet einen Aktions-Text einer Klasse zu.
+
+    Aktionen stammen aus einem kleinen festen Vokabular, daher wird
+    das Ergebnis zwischengespeichert.
+
+    Args:
+        action: Aktion
+
+    Returns:
+        'on', 'off_surplus', 'off_time', 'off_max', 'off_other' oder 'other'
+    """
+    if "eingeschaltet" in action:
+        return 'on'
+    if "ausgeschaltet" in action:
+        if "Überschuss" in action:
+            return 'off_surplus'
+        elif "Zeit" in action:
+            return 'off_time'
+        elif "Maximale" in action:
+            return 'off_max'
+        return 'off_other'
+    return 'other'
+
+
 class DeviceLogger:
     """Logger für Geräte-Events und Status"""
 
@@ -20,7 +64,7 @@ class DeviceLogger:
             log_manager: Zentraler LogManager
         """
         self.log_manager = log_manager
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
 
         # Cache für letzte Zustände
         self.last_device_states: Dict[str, Any] = {}
@@ -94,8 +138,6 @@ class DeviceLogger:
 
                 # Falls kein Cache-Eintrag vorhanden, verwende DeviceState.OFF
                 if old_state is None:
-                    # Importiere DeviceState direkt
-                    from device_management import DeviceState
                     old_state = DeviceState.OFF
 
                 # Bestimme Grund basierend auf Aktion
@@ -115,19 +157,14 @@ class DeviceLogger:
         Returns:
             Grund-String
         """
-        if "eingeschaltet" in action:
+        kind = _classify_action(action)
+        if kind == 'on':
             return f"Überschuss > {device.switch_on_threshold}W"
-        elif "ausgeschaltet" in action:
-            if "Überschuss" in action:
-                return f"Überschuss < {device.switch_off_threshold}W"
-            elif "Zeit" in action:
-                return "Außerhalb erlaubter Zeit"
-            elif "Maximale" in action:
-                return "Maximale Tageslaufzeit erreicht"
-            else:
-                return "Manuell/System"
-        else:
+        elif kind == 'off_surplus':
+            return f"Überschuss < {device.switch_off_threshold}W"
+        elif kind == 'other':
             return action
+        return _FIXED_REASONS[kind]
 
     def create_daily_summary(self, devices: List[Any], output_dir: Any) -> bool:
         """
@@ -144,39 +181,47 @@ class DeviceLogger:
             summary_file = output_dir / f"device_summary_{datetime.now().strftime('%Y%m%d')}.txt"
             current_time = datetime.now()
 
+            parts: List[str] = [
+                _SUMMARY_TITLE.format(current_time.strftime('%d.%m.%Y %H:%M:%S')),
+                _SUMMARY_RULE
+            ]
+
+            total_energy = 0.0
+
+            for device in sorted(devices,
+                                 key=lambda d: d.priority.value if hasattr(d.priority, 'value') else d.priority):
+                priority = device.priority
+                priority_value = priority.value if hasattr(priority, 'value') else priority
+                state = device.state
+
+                # Verwende get_current_runtime() um auch laufende Sessions zu berücksichtigen
+                current_runtime = device.get_current_runtime(current_time)
+                energy = current_runtime * device.power_consumption / 60000
+                total_energy += energy
+
+                parts.append(f"{device.name}:\n")
+                parts.append(f"  Priorität: {priority_value}")
+                if hasattr(priority, 'label'):
+                    parts.append(f" ({priority.label()})")
+                parts.append("\n")
+                parts.append(f"  Leistung: {device.power_consumption}W\n")
+                parts.append(f"  Laufzeit heute: {current_runtime} Minuten")
+
+                # Zeige aktuelle Session-Dauer wenn Gerät läuft
+                if state.value == 'on' and device.last_state_change:
+                    session_minutes = int((current_time - device.last_state_change).total_seconds() / 60)
+                    parts.append(f" (davon aktuelle Session: {session_minutes} Minuten)")
+
+                parts.append("\n")
+                parts.append(f"  Energieverbrauch: {energy:.2f} kWh\n")
+                parts.append(f"  Status: {state.value if hasattr(state, 'value') else state}\n")
+                parts.append("\n")
+
+            parts.append(f"\nGesamt-Energieverbrauch gesteuerte Geräte: {total_energy:.2f} kWh\n")
+
+            # Gesamten Bericht mit einem Aufruf schreiben
             with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(f"Geräte-Tageszusammenfassung - {current_time.strftime('%d.%m.%Y %H:%M:%S')}\n")
-                f.write("=" * 60 + "\n\n")
-
-                total_energy = 0.0
-
-                for device in sorted(devices,
-                                     key=lambda d: d.priority.value if hasattr(d.priority, 'value') else d.priority):
-                    # Verwende get_current_runtime() um auch laufende Sessions zu berücksichtigen
-                    current_runtime = device.get_current_runtime(current_time)
-                    energy = current_runtime * device.power_consumption / 60000
-                    total_energy += energy
-
-                    f.write(f"{device.name}:\n")
-                    f.write(
-                        f"  Priorität: {device.priority.value if hasattr(device.priority, 'value') else device.priority}")
-                    if hasattr(device.priority, 'label'):
-                        f.write(f" ({device.priority.label()})")
-                    f.write("\n")
-                    f.write(f"  Leistung: {device.power_consumption}W\n")
-                    f.write(f"  Laufzeit heute: {current_runtime} Minuten")
-
-                    # Zeige aktuelle Session-Dauer wenn Gerät läuft
-                    if device.state.value == 'on' and device.last_state_change:
-                        session_minutes = int((current_time - device.last_state_change).total_seconds() / 60)
-                        f.write(f" (davon aktuelle Session: {session_minutes} Minuten)")
-
-                    f.write("\n")
-                    f.write(f"  Energieverbrauch: {energy:.2f} kWh\n")
-                    f.write(f"  Status: {device.state.value if hasattr(device.state, 'value') else device.state}\n")
-                    f.write("\n")
-
-                f.write(f"\nGesamt-Energieverbrauch gesteuerte Geräte: {total_energy:.2f} kWh\n")
+                f.write("".join(parts))
 
             self.logger.info(f"Tageszusammenfassung erstellt: {summary_file.name}")
             return True
@@ -8,6 +8,9 @@ from ..core.log_manager import LogManager
 from ..core.log_entry import SolarLogEntry
 
 
+logger = logging.getLogger(__name__)
+
+
 class SolarLogger:
     """Logger für Solar-Daten"""
 
@@ -19,7 +22,7 @@ class SolarLogger:
             log_manager: Zentraler LogManager
         """
         self.log_manager = log_manager
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
 
     def log(self, solar_data: Any) -> bool:
         """
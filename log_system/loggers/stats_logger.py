@@ -8,6 +8,9 @@ from ..core.log_manager import LogManager
 from ..core.log_entry import StatsLogEntry
 
 
+logger = logging.getLogger(__name__)
+
+
 class StatsLogger:
     """Logger für Tagesstatistiken"""
 
@@ -19,7 +22,7 @@ class StatsLogger:
             log_manager: Zentraler LogManager
         """
         self.log_manager = log_manager
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
 
     def log(self, daily_stats: Any) -> bool:
         """
@@ -1,11 +1,12 @@
 """Writer für verschiedene Output-Formate."""
 
-from .base_writer import BaseWriter
+from .base_writer import BaseWriter, BufferEntry
 from .csv_writer import CSVWriter
 from .database_writer import DatabaseWriter
 
 __all__ = [
     "BaseWriter",
+    "BufferEntry",
     "CSVWriter",
     "DatabaseWriter"
 ]
\ No newline at end of file
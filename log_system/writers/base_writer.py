@@ -3,10 +3,17 @@ Basis-Writer für das Logging-System.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, NamedTuple, Optional, List, Tuple
 from ..core.interfaces import LogWriter
 
 
+class BufferEntry(NamedTuple):
+    """Gepufferter Eintrag eines Writers"""
+    data: Dict[str, Any]
+    log_type: Optional[str]
+    metadata: Optional[Dict[str, Any]]
+
+
 class BaseWriter(LogWriter):
     """Basis-Implementierung für alle Writer"""
 
@@ -19,8 +26,8 @@ class BaseWriter(LogWriter):
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._buffer: List[Dict[str, Any]] = []
-        self._buffer_size = 10  # Anzahl Einträge bevor automatischer Flush
+        self._buffer: List[BufferEntry] = []
+        self._buffer_size = config.logging.writer_buffer_size  # Anzahl Einträge bevor automatischer Flush
 
     def write(self, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -34,10 +41,40 @@ class BaseWriter(LogWriter):
             True bei Erfolg
         """
         try:
-            self._buffer.append({
-                'data': data,
-                'metadata': metadata or {}
-            })
+            self._buffer.append(BufferEntry(
+                data,
+                metadata.get('log_type') if metadata else None,
+                metadata
+            ))
+
+            # Auto-flush wenn Buffer voll
+            if len(self._buffer) >= self._buffer_size:
+                return self.flush()
+
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Fehler beim Schreiben: {e}")
+            return False
+
+    def write_many(self, items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> bool:
+        """
+        Fügt mehrere Einträge auf einmal zum Buffer hinzu.
+
+        Der Buffer wird einmal erweitert und höchstens einmal geleert,
+        statt pro Eintrag die Puffergröße zu prüfen.
+
+        Args:
+            items: Liste von (data, metadata)-Tupeln
+
+        Returns:
+            True bei Erfolg
+        """
+        try:
+            self._buffer.extend(
+                BufferEntry(data, metadata.get('log_type') if metadata else None, metadata)
+                for data, metadata in items
+            )
 
             # Auto-flush wenn Buffer voll
             if len(self._buffer) >= self._buffer_size:
@@ -3,10 +3,38 @@ CSV Writer für das Logging-System.
 """
 
 import csv
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set
+from typing import Callable, DefaultDict, Dict, Any, Optional, List, Sequence, Set, TextIO, Tuple
 from datetime import datetime
-from .base_writer import BaseWriter
+from operator import itemgetter
+from .base_writer import BaseWriter, BufferEntry
+from ..formatters import SolarFormatter, StatsFormatter, DeviceEventFormatter
+
+
+# Puffergröße für geöffnete CSV-Dateien (weniger write()-Syscalls je Flush)
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# Log-Typen, deren Werte nur aus Zahlen, Datum/Zeit und "-" bestehen
+_PLAIN_LOG_TYPES = frozenset({'solar', 'stats'})
+
+# Zeichen, die in solchen Werten vorkommen können (inkl. "nan"/"inf")
+_PLAIN_VALUE_CHARS = frozenset('0123456789.,+-: nainf')
+
+# Zeilenende wie beim csv-Modul (Dialekt "excel")
+_LINE_END = '\r\n'
+
+# Vorlagen für Session-Info-Zeilen
+_INFO_TITLE = "# {} Log"
+_INFO_CREATED = "# Erstellt: {}"
+_INFO_FORMAT = "# CSV-Format: Delimiter='{}', Encoding='{}'"
+
+# Feste Spaltenreihenfolge je Log-Typ (aus den Formattern)
+_FIELD_ORDERS: Dict[str, Tuple[str, ...]] = {
+    'solar': SolarFormatter.FIELDS,
+    'stats': StatsFormatter.FIELDS,
+    'device_event': DeviceEventFormatter.FIELDS
+}
 
 
 class CSVWriter(BaseWriter):
@@ -25,11 +53,51 @@ class CSVWriter(BaseWriter):
         self.delimiter = config.csv.delimiter
         self.encoding = config.csv.encoding
 
+        # Formatzeile der Session-Info ändert sich nicht
+        self._info_format_line = _INFO_FORMAT.format(self.delimiter, self.encoding)
+
+        # Zeilen ohne csv-Modul schreiben, wenn der Delimiter in Zahlen nicht vorkommt
+        self._plain_rows = (
+            len(self.delimiter) == 1
+            and self.delimiter not in _PLAIN_VALUE_CHARS
+            and self.delimiter not in '"\r\n'
+        )
+
         # Track welche Dateien bereits Header haben
         self._files_with_headers: Set[Path] = set()
 
-        # Cache für dynamische Header (Device Status)
-        self._dynamic_headers: Dict[str, List[str]] = {}
+        # Beschriftungen für Device-Status-Header
+        if config.csv.use_german_headers:
+            self._status_labels = ("Zeitstempel", "Status", "Laufzeit (min)", {
+                'total_on': "Gesamt Ein",
+                'total_consumption': "Gesamtverbrauch (W)",
+                'surplus_power': "Überschuss (W)",
+                'used_surplus': "Genutzter Überschuss (W)"
+            })
+        else:
+            self._status_labels = ("Timestamp", "State", "Runtime (min)", {
+                'total_on': "Total On",
+                'total_consumption': "Total Consumption (W)",
+                'surplus_power': "Surplus (W)",
+                'used_surplus': "Used Surplus (W)"
+            })
+
+        # Cache für Device-Status-Header, Schlüssel: Feldnamen
+        self._device_status_headers: Dict[Tuple[str, ...], List[str]] = {}
+
+        # Verzeichnisse, die bereits existieren
+        self._known_dirs: Set[Path] = set()
+
+        # Offene Dateien je log_type: (Pfad, Datei, csv.writer)
+        self._open_files: Dict[str, Tuple[Path, TextIO, Any]] = {}
+
+        # Feldnamen der festen Log-Typen
+        self._field_cache: Dict[str, List[str]] = {
+            log_type: list(fields) for log_type, fields in _FIELD_ORDERS.items()
+        }
+
+        # Cache für dynamische Feldnamen, Schlüssel: Keys der Beispiel-Daten
+        self._dynamic_fields: Dict[Tuple[str, ...], List[str]] = {}
 
     def write(self, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -49,6 +117,24 @@ class CSVWriter(BaseWriter):
         # Füge zu Buffer hinzu
         return super().write(data, metadata)
 
+    def write_many(self, items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> bool:
+        """
+        Schreibt mehrere Einträge in CSV-Dateien.
+
+        Args:
+            items: Liste von (data, metadata)-Tupeln mit log_type in den Metadaten
+
+        Returns:
+            True bei Erfolg
+        """
+        valid = [item for item in items if item[1] and 'log_type' in item[1]]
+        if len(valid) != len(items):
+            self.logger.error("Keine log_type in Metadaten")
+            super().write_many(valid)
+            return False
+
+        return super().write_many(items)
+
     def flush(self) -> bool:
         """
         Schreibt Buffer in CSV-Dateien.
@@ -60,12 +146,9 @@ class CSVWriter(BaseWriter):
             return True
 
         # Gruppiere Buffer nach log_type
-        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        grouped: DefaultDict[str, List[BufferEntry]] = defaultdict(list)
         for entry in self._buffer:
-            log_type = entry['metadata'].get('log_type')
-            if log_type not in grouped:
-                grouped[log_type] = []
-            grouped[log_type].append(entry)
+            grouped[entry.log_type].append(entry)
 
         # Schreibe jede Gruppe
         success = True
@@ -77,7 +160,7 @@ class CSVWriter(BaseWriter):
         self._buffer.clear()
         return success
 
-    def _write_group(self, log_type: str, entries: List[Dict[str, Any]]) -> bool:
+    def _write_group(self, log_type: str, entries: List[BufferEntry]) -> bool:
         """
         Schreibt eine Gruppe von Einträgen.
 
@@ -92,49 +175,123 @@ class CSVWriter(BaseWriter):
             # Hole aktuellen Pfad
             filepath = self.file_manager.get_current_path(log_type)
 
-            # Stelle sicher dass Verzeichnis existiert
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-
-            # Prüfe ob Header geschrieben werden muss
-            file_exists = filepath.exists()
-            write_header = filepath not in self._files_with_headers and not file_exists
-
             # Hole Feldnamen
-            fieldnames = self._get_fieldnames(log_type, entries[0]['data'])
-
-            # Öffne Datei
-            mode = 'w' if write_header else 'a'
-            with open(filepath, mode, newline='', encoding=self.encoding) as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=fieldnames,
-                    delimiter=self.delimiter
-                )
-
-                # Schreibe Header wenn nötig
-                if write_header:
-                    # Spezielle Header für device_status
-                    if log_type == 'device_status':
-                        self._write_device_status_header(f, entries[0]['data'])
-                    else:
-                        writer.writeheader()
-
-                    self._files_with_headers.add(filepath)
-
-                    # Session-Info wenn konfiguriert (außer für device_status)
-                    if self.config.csv.include_info_row and log_type != 'device_status':
-                        self._write_session_info(f, log_type)
-
-                # Schreibe Daten
-                for entry in entries:
-                    writer.writerow(entry['data'])
+            fieldnames = self._get_fieldnames(log_type, entries[0].data)
+
+            # Offene Datei wiederverwenden, bei neuem Pfad (Tageswechsel) neu öffnen
+            handle = self._open_files.get(log_type)
+            if handle is None or handle[0] != filepath:
+                handle = self._open_file(log_type, filepath, fieldnames, entries[0].data)
+            _, f, writer = handle
+
+            # Schreibe Daten positionsweise in Spaltenreihenfolge
+            get_row = self._row_getter(log_type, fieldnames)
+            if self._plain_rows and log_type in _PLAIN_LOG_TYPES:
+                # Werte brauchen nie Quoting: Zeilen direkt zusammensetzen
+                join = self.delimiter.join
+                f.write(''.join([join(get_row(entry.data)) + _LINE_END for entry in entries]))
+            else:
+                writer.writerows(map(get_row, (entry.data for entry in entries)))
+            f.flush()
 
             return True
 
         except Exception as e:
             self.logger.error(f"Fehler beim Schreiben nach {log_type}: {e}")
+            self._close_file(log_type)
             return False
 
+    def _open_file(self, log_type: str, filepath: Path, fieldnames: List[str],
+                   sample_data: Dict[str, Any]) -> Tuple[Path, TextIO, Any]:
+        """
+        Öffnet die Datei eines Log-Typs und schreibt bei Bedarf den Header.
+
+        Args:
+            log_type: Typ des Logs
+            filepath: Pfad zur Datei
+            fieldnames: Spalten in Ausgabereihenfolge
+            sample_data: Beispiel-Daten für dynamische Header
+
+        Returns:
+            Tupel (Pfad, Datei, csv.writer)
+        """
+        # Datei des vorherigen Tages schließen
+        self._close_file(log_type)
+
+        # Stelle sicher dass Verzeichnis existiert (einmal je Verzeichnis)
+        if filepath.parent not in self._known_dirs:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(filepath.parent)
+
+        # Prüfe ob Header geschrieben werden muss (bekannte Dateien ohne Syscall)
+        write_header = filepath not in self._files_with_headers and not filepath.exists()
+        if not write_header:
+            self._files_with_headers.add(filepath)
+
+        f = open(filepath, 'a', buffering=_FILE_BUFFER_SIZE, newline='', encoding=self.encoding)
+        writer = csv.writer(f, delimiter=self.delimiter)
+
+        # Schreibe Header wenn nötig
+        if write_header:
+            # Spezielle Header für device_status
+            if log_type == 'device_status':
+                self._write_device_status_header(f, fieldnames)
+            else:
+                writer.writerow(fieldnames)
+
+            self._files_with_headers.add(filepath)
+
+            # Session-Info wenn konfiguriert (außer für device_status)
+            if self.config.csv.include_info_row and log_type != 'device_status':
+                self._write_session_info(f, log_type)
+
+        handle = (filepath, f, writer)
+        self._open_files[log_type] = handle
+        return handle
+
+    def _close_file(self, log_type: str) -> None:
+        """
+        Schließt die offene Datei eines Log-Typs.
+
+        Args:
+            log_type: Typ des Logs
+        """
+        handle = self._open_files.pop(log_type, None)
+        if handle is None:
+            return
+
+        try:
+            handle[1].close()
+        except Exception as e:
+            self.logger.error(f"Fehler beim Schließen von {handle[0]}: {e}")
+
+    def close(self) -> None:
+        """Schließt alle offenen CSV-Dateien."""
+        for log_type in list(self._open_files):
+            self._close_file(log_type)
+
+    def _row_getter(self, log_type: str, fieldnames: List[str]) -> Callable[[Dict[str, Any]], Sequence[Any]]:
+        """
+        Erstellt eine Funktion, die ein Daten-Dict als Zeile projiziert.
+
+        Args:
+            log_type: Typ des Logs
+            fieldnames: Spalten in Ausgabereihenfolge
+
+        Returns:
+            Funktion Dict -> Zeilenwerte
+        """
+        if log_type not in _FIELD_ORDERS:
+            # Dynamische Spalten (device_status): fehlende Werte leer lassen
+            return lambda data: [data.get(name, '') for name in fieldnames]
+
+        if len(fieldnames) == 1:
+            # itemgetter mit einem Feld liefert keinen Tupel
+            name = fieldnames[0]
+            return lambda data: (data[name],)
+
+        return itemgetter(*fieldnames)
+
     def _get_fieldnames(self, log_type: str, sample_data: Dict[str, Any]) -> List[str]:
         """
         Bestimmt die Feldnamen für einen Log-Typ.
@@ -143,6 +300,29 @@ class CSVWriter(BaseWriter):
             log_type: Typ des Logs
             sample_data: Beispiel-Daten
 
+        Returns:
+            Liste von Feldnamen
+        """
+        fieldnames = self._field_cache.get(log_type)
+        if fieldnames is not None:
+            return fieldnames
+
+        # Dynamische Felder: einmal je Key-Satz berechnen
+        keys = tuple(sample_data)
+        fieldnames = self._dynamic_fields.get(keys)
+        if fieldnames is None:
+            fieldnames = self._build_dynamic_fieldnames(log_type, keys)
+            self._dynamic_fields[keys] = fieldnames
+        return fieldnames
+
+    def _build_dynamic_fieldnames(self, log_type: str, keys: Tuple[str, ...]) -> List[str]:
+        """
+        Bestimmt die Feldnamen für Log-Typen ohne feste Reihenfolge.
+
+        Args:
+            log_type: Typ des Logs
+            keys: Keys der Beispiel-Daten
+
         Returns:
             Liste von Feldnamen
         """
@@ -153,7 +333,7 @@ class CSVWriter(BaseWriter):
 
             # Sammle alle Geräte-Keys in sortierter Reihenfolge
             device_keys = []
-            for key in sorted(sample_data.keys()):
+            for key in sorted(keys):
                 if key.endswith('_state'):
                     device_base = key.replace('_state', '')
                     device_keys.append(device_base)
@@ -168,88 +348,53 @@ class CSVWriter(BaseWriter):
 
             return fieldnames
 
-        # Sonst: Feste Reihenfolge
-        field_orders = {
-            'solar': [
-                'timestamp', 'pv_power', 'grid_power', 'battery_power',
-                'load_power', 'battery_soc', 'total_production',
-                'feed_in_power', 'grid_consumption', 'self_consumption',
-                'autarky_rate', 'surplus_power'
-            ],
-            'stats': [
-                'date', 'runtime_hours', 'pv_energy', 'consumption_energy',
-                'self_consumption_energy', 'feed_in_energy', 'grid_energy',
-                'grid_energy_day', 'grid_energy_night', 'battery_charge_energy',
-                'battery_discharge_energy', 'pv_power_max', 'consumption_power_max',
-                'feed_in_power_max', 'grid_power_max', 'surplus_power_max',
-                'battery_soc_min', 'battery_soc_max', 'autarky_avg',
-                'self_sufficiency_rate', 'cost_grid_consumption',
-                'revenue_feed_in', 'cost_saved', 'total_benefit',
-                'cost_without_solar'
-            ],
-            'device_event': [
-                'timestamp', 'device_name', 'action', 'from_state',
-                'to_state', 'reason', 'surplus_power', 'device_power',
-                'on_threshold', 'off_threshold', 'runtime_today', 'priority'
-            ]
-        }
-
-        return field_orders.get(log_type, sorted(sample_data.keys()))
+        return sorted(keys)
 
-    def _write_device_status_header(self, file_handle: Any, sample_data: Dict[str, Any]) -> None:
+    def _write_device_status_header(self, file_handle: Any, fieldnames: List[str]) -> None:
         """
         Schreibt spezielle Header für Device Status.
 
         Args:
             file_handle: Offene Datei
-            sample_data: Beispiel-Daten für Header-Generierung
+            fieldnames: Feldnamen aus _get_fieldnames()
         """
-        # Erstelle lesbare Header basierend auf den Daten-Keys
-        headers = []
-
-        # Timestamp immer zuerst
-        headers.append("Zeitstempel" if self.config.csv.use_german_headers else "Timestamp")
-
-        # Sammle alle Geräte-Keys
-        device_keys = []
-        for key in sorted(sample_data.keys()):
-            if key.endswith('_state'):
-                device_name = key.replace('_state', '').replace('_', ' ').title()
-                device_keys.append((device_name, key.replace('_state', '')))
-
-        # Füge Geräte-Header hinzu
-        for device_name, device_key in device_keys:
-            if self.config.csv.use_german_headers:
-                headers.extend([
-                    f"{device_name} Status",
-                    f"{device_name} Laufzeit (min)"
-                ])
-            else:
-                headers.extend([
-                    f"{device_name} State",
-                    f"{device_name} Runtime (min)"
-                ])
-
-        # Zusammenfassungs-Header
-        if self.config.csv.use_german_headers:
-            headers.extend([
-                "Gesamt Ein",
-                "Gesamtverbrauch (W)",
-                "Überschuss (W)",
-                "Genutzter Überschuss (W)"
-            ])
-        else:
-            headers.extend([
-                "Total On",
-                "Total Consumption (W)",
-                "Surplus (W)",
-                "Used Surplus (W)"
-            ])
+        key = tuple(fieldnames)
+        headers = self._device_status_headers.get(key)
+        if headers is None:
+            headers = self._build_device_status_header(fieldnames)
+            self._device_status_headers[key] = headers
 
         # Schreibe Header
         writer = csv.writer(file_handle, delimiter=self.delimiter)
         writer.writerow(headers)
 
+    def _build_device_status_header(self, fieldnames: List[str]) -> List[str]:
+        """
+        Erstellt lesbare Header passend zu den Device-Status-Feldnamen.
+
+        Args:
+            fieldnames: Feldnamen aus _get_fieldnames()
+
+        Returns:
+            Liste von Header-Spalten
+        """
+        timestamp_label, state_suffix, runtime_suffix, summary_labels = self._status_labels
+
+        headers = []
+        for name in fieldnames:
+            if name == 'timestamp':
+                headers.append(timestamp_label)
+            elif name in summary_labels:
+                headers.append(summary_labels[name])
+            elif name.endswith('_state'):
+                headers.append(f"{name[:-len('_state')].replace('_', ' ').title()} {state_suffix}")
+            elif name.endswith('_runtime'):
+                headers.append(f"{name[:-len('_runtime')].replace('_', ' ').title()} {runtime_suffix}")
+            else:
+                headers.append(name)
+
+        return headers
+
     def _write_session_info(self, file_handle: Any, log_type: str) -> None:
         """
         Schreibt Session-Info in Datei.
@@ -260,17 +405,13 @@ class CSVWriter(BaseWriter):
         """
         writer = csv.writer(file_handle, delimiter=self.delimiter)
 
-        info_lines = [
-            f"# {log_type.upper()} Log",
-            f"# Erstellt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"# CSV-Format: Delimiter='{self.delimiter}', Encoding='{self.encoding}'"
-        ]
-
-        for line in info_lines:
-            writer.writerow([line])
-
-        # Leerzeile nach Info
-        writer.writerow([])
+        # Feste Zeilen aus Vorlagen, Leerzeile nach Info
+        writer.writerows((
+            (_INFO_TITLE.format(log_type.upper()),),
+            (_INFO_CREATED.format(datetime.now().strftime('%Y-%m-%d %H:%M:%S')),),
+            (self._info_format_line,),
+            ()
+        ))
 
     def write_header(self, headers: List[str], metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -2,13 +2,192 @@
 Database Writer für das Logging-System.
 """
 
+import json
 import sqlite3
-from typing import Dict, Any, Optional, List
+from operator import itemgetter
+from collections import defaultdict
+from typing import DefaultDict, Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
 from .base_writer import BaseWriter
 
 
+# Spalten je Log-Typ in Reihenfolge der INSERT-Parameter
+_get_solar_values = itemgetter(
+    'timestamp', 'pv_power', 'grid_power', 'battery_power', 'load_power',
+    'battery_soc', 'feed_in_power', 'grid_consumption', 'self_consumption',
+    'autarky_rate', 'surplus_power'
+)
+_get_stats_values = itemgetter(
+    'date', 'runtime_hours', 'pv_energy', 'consumption_energy',
+    'self_consumption_energy', 'feed_in_energy', 'grid_energy',
+    'grid_energy_day', 'grid_energy_night', 'battery_charge_energy',
+    'battery_discharge_energy', 'pv_power_max', 'consumption_power_max',
+    'feed_in_power_max', 'grid_power_max', 'surplus_power_max',
+    'battery_soc_min', 'battery_soc_max', 'autarky_avg',
+    'self_sufficiency_rate', 'cost_grid_consumption', 'revenue_feed_in',
+    'cost_saved', 'total_benefit', 'cost_without_solar'
+)
+_get_device_event_texts = itemgetter(
+    'device_name', 'action', 'from_state', 'to_state', 'reason'
+)
+_get_device_event_numbers = itemgetter(
+    'surplus_power', 'device_power', 'priority', 'runtime_today'
+)
+_get_device_status_numbers = itemgetter(
+    'total_on', 'total_consumption', 'surplus_power', 'used_surplus'
+)
+
+# Kompaktes JSON für Gerätezustände (ein Encoder statt json.dumps pro Zeile)
+_encode_device_states = json.JSONEncoder(separators=(',', ':')).encode
+
+
+# Zusammenführung mehrerer Stats-Zeilen desselben Datums, wie im UPSERT:
+# Summe für Energie/Kosten, MAX für Spitzenwerte, SOC-Grenzen, sonst letzter Wert
+def _merge_sum(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    """Summe (NULL bleibt NULL)"""
+    return None if old is None or new is None else old + new
+
+
+def _merge_max(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    """Maximum (NULL bleibt NULL)"""
+    return None if old is None or new is None else max(old, new)
+
+
+def _merge_soc_min(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    """Minimum wie MIN(COALESCE(alt, neu), neu)"""
+    if new is None:
+        return None
+    return new if old is None else min(old, new)
+
+
+def _merge_soc_max(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    """Maximum wie MAX(COALESCE(alt, neu), neu)"""
+    if new is None:
+        return None
+    return new if old is None else max(old, new)
+
+
+def _merge_last(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    """Letzter Wert"""
+    return new
+
+
+# Je Spalte von _get_stats_values ohne 'date'
+_STATS_MERGE = (
+    (_merge_sum,) * 10          # runtime_hours .. battery_discharge_energy
+    + (_merge_max,) * 5         # pv_power_max .. surplus_power_max
+    + (_merge_soc_min, _merge_soc_max, _merge_last, _merge_last)
+    + (_merge_sum,) * 5         # cost_grid_consumption .. cost_without_solar
+)
+
+
+def _parse_number(value: Any) -> Optional[float]:
+    """Parst eine Zahl aus formatiertem String"""
+    # Bereits numerisch: kein String-Parsing nötig
+    value_type = value.__class__
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+
+    if value is None or value == '-':
+        return None
+
+    # Formatter schreiben keine Tausender-Trennzeichen, nur das Dezimalzeichen
+    # ("," oder ".") muss vereinheitlicht werden
+    if value_type is str:
+        value = value.replace(',', '.')
+
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_timestamp(value: Any) -> Optional[str]:
+    """Parst einen Timestamp"""
+    # Üblicher Fall: vom Formatter bereits als String geliefert
+    if value.__class__ is str:
+        return None if value == '-' else value
+    if value is None:
+        return None
+    return str(value)
+
+
+# Schema-Version (PRAGMA user_version); erhöhen, wenn sich Tabellen oder Indizes ändern
+_SCHEMA_VERSION = 1
+
+# Einstellungen je Verbindung: WAL statt Rollback-Journal, kein fsync pro Commit
+# (bei Absturz gehen höchstens die letzten Sekunden Telemetrie verloren)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000"
+)
+
+# SQL-Anweisungen (gleicher String je Anweisung, damit der Statement-Cache trifft)
+_SQL_INSERT_SOLAR = """
+    INSERT INTO solar_data (timestamp, pv_power, grid_power, battery_power, \
+                            load_power, battery_soc, feed_in_power, grid_consumption, \
+                            self_consumption, autarky_rate, surplus_power) \
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) \
+    """
+
+_SQL_UPSERT_STATS = """
+    INSERT INTO daily_stats (date, runtime_hours, pv_energy, consumption_energy, \
+                             self_consumption_energy, feed_in_energy, grid_energy, \
+                             grid_energy_day, grid_energy_night, \
+                             battery_charge_energy, battery_discharge_energy, \
+                             pv_power_max, consumption_power_max, feed_in_power_max, \
+                             grid_power_max, surplus_power_max, battery_soc_min, \
+                             battery_soc_max, autarky_avg, self_sufficiency_rate, \
+                             cost_grid_consumption, revenue_feed_in, cost_saved, \
+                             total_benefit, cost_without_solar) \
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE
+    SET runtime_hours            = runtime_hours + excluded.runtime_hours,
+        pv_energy                = pv_energy + excluded.pv_energy,
+        consumption_energy       = consumption_energy + excluded.consumption_energy,
+        self_consumption_energy  = self_consumption_energy + excluded.self_consumption_energy,
+        feed_in_energy           = feed_in_energy + excluded.feed_in_energy,
+        grid_energy              = grid_energy + excluded.grid_energy,
+        grid_energy_day          = grid_energy_day + excluded.grid_energy_day,
+        grid_energy_night        = grid_energy_night + excluded.grid_energy_night,
+        battery_charge_energy    = battery_charge_energy + excluded.battery_charge_energy,
+        battery_discharge_energy = battery_discharge_energy + excluded.battery_discharge_energy,
+        pv_power_max             = MAX(pv_power_max, excluded.pv_power_max),
+        consumption_power_max    = MAX(consumption_power_max, excluded.consumption_power_max),
+        feed_in_power_max        = MAX(feed_in_power_max, excluded.feed_in_power_max),
+        grid_power_max           = MAX(grid_power_max, excluded.grid_power_max),
+        surplus_power_max        = MAX(surplus_power_max, excluded.surplus_power_max),
+        battery_soc_min          = MIN(COALESCE(battery_soc_min, excluded.battery_soc_min), excluded.battery_soc_min),
+        battery_soc_max          = MAX(COALESCE(battery_soc_max, excluded.battery_soc_max), excluded.battery_soc_max),
+        autarky_avg              = excluded.autarky_avg,
+        self_sufficiency_rate    = excluded.self_sufficiency_rate,
+        cost_grid_consumption    = cost_grid_consumption + excluded.cost_grid_consumption,
+        revenue_feed_in          = revenue_feed_in + excluded.revenue_feed_in,
+        cost_saved               = cost_saved + excluded.cost_saved,
+        total_benefit            = total_benefit + excluded.total_benefit,
+        cost_without_solar       = cost_without_solar + excluded.cost_without_solar
+    """
+
+_SQL_INSERT_DEVICE_EVENT = """
+    INSERT INTO device_events (timestamp, device_name, action, old_state, new_state, \
+                               reason, surplus_power, device_power, priority, runtime_today) \
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) \
+    """
+
+_SQL_INSERT_DEVICE_STATUS = """
+    INSERT INTO device_status (timestamp, total_devices_on, total_consumption, \
+                               surplus_power, used_surplus, device_states) \
+    VALUES (?, ?, ?, ?, ?, ?) \
+    """
+
+
 class DatabaseWriter(BaseWriter):
     """Writer für SQLite-Datenbank"""
 
@@ -23,127 +202,214 @@ class DatabaseWriter(BaseWriter):
         self.db_path = Path(config.database.database_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Größerer Buffer für Datenbank
-        self._buffer_size = 100
+        # Größerer Buffer für Datenbank (mehr Zeilen pro Transaktion)
+        self._buffer_size = config.database.buffer_size
+
+        # Buffer bereits nach log_type gruppiert (statt Gruppierung bei jedem Flush)
+        self._pending: DefaultDict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        self._pending_count = 0
+
+        # Eine Verbindung für die gesamte Laufzeit (Statement- und Page-Cache bleiben erhalten)
+        self._conn: Optional[sqlite3.Connection] = None
 
         # Initialisiere Datenbank
         self._init_database()
 
     def _init_database(self) -> None:
         """Erstellt die Tabellen falls sie nicht existieren"""
+        conn = None
         try:
-            with self._get_connection() as conn:
-                # Solar-Daten Tabelle
-                conn.execute("""
-                             CREATE TABLE IF NOT EXISTS solar_data
-                             (
-                                 id               INTEGER PRIMARY KEY AUTOINCREMENT,
-                                 timestamp        DATETIME NOT NULL,
-                                 pv_power         REAL     NOT NULL,
-                                 grid_power       REAL     NOT NULL,
-                                 battery_power    REAL     DEFAULT 0,
-                                 load_power       REAL     NOT NULL,
-                                 battery_soc      REAL,
-                                 feed_in_power    REAL     NOT NULL,
-                                 grid_consumption REAL     NOT NULL,
-                                 self_consumption REAL     NOT NULL,
-                                 autarky_rate     REAL     NOT NULL,
-                                 surplus_power    REAL     NOT NULL,
-                                 created_at       DATETIME DEFAULT CURRENT_TIMESTAMP
-                             )
-                             """)
-
-                # Index für Zeitabfragen
-                conn.execute("""
-                             CREATE INDEX IF NOT EXISTS idx_solar_timestamp
-                                 ON solar_data (timestamp)
-                             """)
-
-                # Tagesstatistiken Tabelle
-                conn.execute("""
-                             CREATE TABLE IF NOT EXISTS daily_stats
-                             (
-                                 id                       INTEGER PRIMARY KEY AUTOINCREMENT,
-                                 date                     DATE NOT NULL UNIQUE,
-                                 runtime_hours            REAL NOT NULL,
-                                 pv_energy                REAL NOT NULL,
-                                 consumption_energy       REAL NOT NULL,
-                                 self_consumption_energy  REAL NOT NULL,
-                                 feed_in_energy           REAL NOT NULL,
-                                 grid_energy              REAL NOT NULL,
-                                 grid_energy_day          REAL     DEFAULT 0,
-                                 grid_energy_night        REAL     DEFAULT 0,
-                                 battery_charge_energy    REAL     DEFAULT 0,
-                                 battery_discharge_energy REAL     DEFAULT 0,
-                                 pv_power_max             REAL NOT NULL,
-                                 consumption_power_max    REAL NOT NULL,
-                                 feed_in_power_max        REAL NOT NULL,
-                                 grid_power_max           REAL NOT NULL,
-                                 surplus_power_max        REAL NOT NULL,
-                                 battery_soc_min          REAL,
-                                 battery_soc_max          REAL,
-                                 autarky_avg              REAL NOT NULL,
-                                 self_sufficiency_rate    REAL NOT NULL,
-                                 cost_grid_consumption    REAL     DEFAULT 0,
-                                 revenue_feed_in          REAL     DEFAULT 0,
-                                 cost_saved               REAL     DEFAULT 0,
-                                 total_benefit            REAL     DEFAULT 0,
-                                 cost_without_solar       REAL     DEFAULT 0,
-                                 created_at               DATETIME DEFAULT CURRENT_TIMESTAMP
-                             )
-                             """)
-
-                # Geräte-Events Tabelle
-                conn.execute("""
-                             CREATE TABLE IF NOT EXISTS device_events
-                             (
-                                 id            INTEGER PRIMARY KEY AUTOINCREMENT,
-                                 timestamp     DATETIME NOT NULL,
-                                 device_name   TEXT     NOT NULL,
-                                 action        TEXT     NOT NULL,
-                                 old_state     TEXT,
-                                 new_state     TEXT     NOT NULL,
-                                 reason        TEXT,
-                                 surplus_power REAL,
-                                 device_power  REAL     NOT NULL,
-                                 priority      INTEGER  NOT NULL,
-                                 runtime_today INTEGER,
-                                 created_at    DATETIME DEFAULT CURRENT_TIMESTAMP
-                             )
-                             """)
-
-                # Geräte-Status Tabelle
-                conn.execute("""
-                             CREATE TABLE IF NOT EXISTS device_status
-                             (
-                                 id                INTEGER PRIMARY KEY AUTOINCREMENT,
-                                 timestamp         DATETIME NOT NULL,
-                                 total_devices_on  INTEGER  NOT NULL DEFAULT 0,
-                                 total_consumption REAL     NOT NULL DEFAULT 0,
-                                 surplus_power     REAL     NOT NULL DEFAULT 0,
-                                 used_surplus      REAL     NOT NULL DEFAULT 0,
-                                 device_states     TEXT, -- JSON mit Gerätezuständen
-                                 created_at        DATETIME          DEFAULT CURRENT_TIMESTAMP
-                             )
-                             """)
-
-                # Index für Zeitabfragen
-                conn.execute("""
-                             CREATE INDEX IF NOT EXISTS idx_device_status_timestamp
-                                 ON device_status (timestamp)
-                             """)
-
-                conn.commit()
-                self.logger.info(f"Datenbank initialisiert: {self.db_path}")
+            conn = self._get_connection()
+
+            # Schema bereits auf aktuellem Stand: keine DDL (und keine Schreibsperre) nötig
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+
+            # Solar-Daten Tabelle
+            conn.execute("""
+                         CREATE TABLE IF NOT EXISTS solar_data
+                         (
+                             id               INTEGER PRIMARY KEY AUTOINCREMENT,
+                             timestamp        DATETIME NOT NULL,
+                             pv_power         REAL     NOT NULL,
+                             grid_power       REAL     NOT NULL,
+                             battery_power    REAL     DEFAULT 0,
+                             load_power       REAL     NOT NULL,
+                             battery_soc      REAL,
+                             feed_in_power    REAL     NOT NULL,
+                             grid_consumption REAL     NOT NULL,
+                             self_consumption REAL     NOT NULL,
+                             autarky_rate     REAL     NOT NULL,
+                             surplus_power    REAL     NOT NULL,
+                             created_at       DATETIME DEFAULT CURRENT_TIMESTAMP
+                         )
+                         """)
+
+            # Abdeckender Index für Zeitabfragen (häufig gelesene Spalten ohne Rowid-Lookup),
+            # ersetzt den reinen Timestamp-Index
+            conn.execute("DROP INDEX IF EXISTS idx_solar_timestamp")
+            conn.execute("""
+                         CREATE INDEX IF NOT EXISTS idx_solar_ts_cov
+                             ON solar_data (timestamp, pv_power, load_power, surplus_power, battery_soc)
+                         """)
+
+            # Tagesstatistiken Tabelle
+            conn.execute("""
+                         CREATE TABLE IF NOT EXISTS daily_stats
+                         (
+                             id                       INTEGER PRIMARY KEY AUTOINCREMENT,
+                             date                     DATE NOT NULL UNIQUE,
+                             runtime_hours            REAL NOT NULL,
+                             pv_energy                REAL NOT NULL,
+                             consumption_energy       REAL NOT NULL,
+                             self_consumption_energy  REAL NOT NULL,
+                             feed_in_energy           REAL NOT NULL,
+                             grid_energy              REAL NOT NULL,
+                             grid_energy_day          REAL     DEFAULT 0,
+                             grid_energy_night        REAL     DEFAULT 0,
+                             battery_charge_energy    REAL     DEFAULT 0,
+                             battery_discharge_energy REAL     DEFAULT 0,
+                             pv_power_max             REAL NOT NULL,
+                             consumption_power_max    REAL NOT NULL,
+                             feed_in_power_max        REAL NOT NULL,
+                             grid_power_max           REAL NOT NULL,
+                             surplus_power_max        REAL NOT NULL,
+                             battery_soc_min          REAL,
+                             battery_soc_max          REAL,
+                             autarky_avg              REAL NOT NULL,
+                             self_sufficiency_rate    REAL NOT NULL,
+                             cost_grid_consumption    REAL     DEFAULT 0,
+                             revenue_feed_in          REAL     DEFAULT 0,
+                             cost_saved               REAL     DEFAULT 0,
+                             total_benefit            REAL     DEFAULT 0,
+                             cost_without_solar       REAL     DEFAULT 0,
+                             created_at               DATETIME DEFAULT CURRENT_TIMESTAMP
+                         )
+                         """)
+
+            # Geräte-Events Tabelle
+            conn.execute("""
+                         CREATE TABLE IF NOT EXISTS device_events
+                         (
+                             id            INTEGER PRIMARY KEY AUTOINCREMENT,
+                             timestamp     DATETIME NOT NULL,
+                             device_name   TEXT     NOT NULL,
+                             action        TEXT     NOT NULL,
+                             old_state     TEXT,
+                             new_state     TEXT     NOT NULL,
+                             reason        TEXT,
+                             surplus_power REAL,
+                             device_power  REAL     NOT NULL,
+                             priority      INTEGER  NOT NULL,
+                             runtime_today INTEGER,
+                             created_at    DATETIME DEFAULT CURRENT_TIMESTAMP
+                         )
+                         """)
+
+            # Geräte-Status Tabelle
+            conn.execute("""
+                         CREATE TABLE IF NOT EXISTS device_status
+                         (
+                             id                INTEGER PRIMARY KEY AUTOINCREMENT,
+                             timestamp         DATETIME NOT NULL,
+                             total_devices_on  INTEGER  NOT NULL DEFAULT 0,
+                             total_consumption REAL     NOT NULL DEFAULT 0,
+                             surplus_power     REAL     NOT NULL DEFAULT 0,
+                             used_surplus      REAL     NOT NULL DEFAULT 0,
+                             device_states     TEXT, -- JSON mit Gerätezuständen
+                             created_at        DATETIME          DEFAULT CURRENT_TIMESTAMP
+                         )
+                         """)
+
+            # Abdeckender Index für Zeitabfragen, ersetzt den reinen Timestamp-Index
+            conn.execute("DROP INDEX IF EXISTS idx_device_status_timestamp")
+            conn.execute("""
+                         CREATE INDEX IF NOT EXISTS idx_device_status_ts_cov
+                             ON device_status (timestamp, total_devices_on, total_consumption,
+                                               surplus_power, used_surplus)
+                         """)
+
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+
+            # Statistiken für den Query-Planer (Aufwand pro Index begrenzt)
+            conn.execute("PRAGMA analysis_limit=400")
+            conn.execute("ANALYZE")
+
+            self.logger.info(f"Datenbank initialisiert: {self.db_path}")
 
         except Exception as e:
             self.logger.error(f"Fehler bei Datenbank-Initialisierung: {e}")
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Erstellt eine Datenbankverbindung"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Gibt die Datenbankverbindung zurück und öffnet sie beim ersten Aufruf"""
+        if self._conn is None:
+            # Flush kann aus dem Logging-Worker-Thread kommen (LOG_ASYNC)
+            # Transaktionen werden in flush() explizit gesteuert (isolation_level=None)
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Schließt die Datenbankverbindung"""
+        if self._conn is not None:
+            try:
+                # Planer-Statistiken bei Bedarf aktualisieren
+                self._conn.execute("PRAGMA optimize")
+            except Exception as e:
+                self.logger.warning(f"PRAGMA optimize fehlgeschlagen: {e}")
+            try:
+                self._conn.close()
+            except Exception as e:
+                self.logger.error(f"Fehler beim Schließen der Datenbank: {e}")
+            self._conn = None
+
+    def write(self, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Fügt Daten zum Buffer ihres log_type hinzu.
+
+        Args:
+            data: Zu schreibende Daten
+            metadata: Metadaten mit log_type
+
+        Returns:
+            True bei Erfolg
+        """
+        self._pending[metadata.get('log_type') if metadata else None].append(data)
+        self._pending_count += 1
+
+        # Auto-flush wenn Buffer voll
+        if self._pending_count >= self._buffer_size:
+            return self.flush()
+        return True
+
+    def write_many(self, items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> bool:
+        """
+        Fügt mehrere Einträge zu den Buffern ihres log_type hinzu.
+
+        Args:
+            items: Liste von (data, metadata)-Tupeln
+
+        Returns:
+            True bei Erfolg
+        """
+        pending = self._pending
+        for data, metadata in items:
+            pending[metadata.get('log_type') if metadata else None].append(data)
+        self._pending_count += len(items)
+
+        # Auto-flush wenn Buffer voll
+        if self._pending_count >= self._buffer_size:
+            return self.flush()
+        return True
 
     def flush(self) -> bool:
         """
@@ -152,36 +418,33 @@ class DatabaseWriter(BaseWriter):
         Returns:
             True bei Erfolg
         """
-        if not self._buffer:
+        if not self._pending_count:
             return True
 
-        # Gruppiere nach log_type
-        grouped: Dict[str, List[Dict[str, Any]]] = {}
-        for entry in self._buffer:
-            log_type = entry['metadata'].get('log_type')
-            if log_type not in grouped:
-                grouped[log_type] = []
-            grouped[log_type].append(entry['data'])
+        grouped = self._pending
 
-        # Schreibe jede Gruppe
+        # Schreibe alle Gruppen in einer Transaktion (Schreibsperre nur einmal holen)
         success = True
+        conn = None
         try:
-            with self._get_connection() as conn:
-                for log_type, data_list in grouped.items():
-                    if not self._write_batch(conn, log_type, data_list):
-                        success = False
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+
+            for log_type, data_list in grouped.items():
+                if not self._write_batch(conn, log_type, data_list):
+                    success = False
 
-                if success:
-                    conn.commit()
-                else:
-                    conn.rollback()
+            conn.execute("COMMIT" if success else "ROLLBACK")
 
         except Exception as e:
             self.logger.error(f"Fehler beim Datenbank-Flush: {e}")
             success = False
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
 
         # Buffer leeren
-        self._buffer.clear()
+        grouped.clear()
+        self._pending_count = 0
         return success
 
     def _write_batch(self, conn: sqlite3.Connection, log_type: str,
@@ -217,232 +480,66 @@ class DatabaseWriter(BaseWriter):
     def _write_solar_batch(self, conn: sqlite3.Connection,
                            data_list: List[Dict[str, Any]]) -> bool:
         """Schreibt Solar-Daten"""
-        sql = """
-              INSERT INTO solar_data (timestamp, pv_power, grid_power, battery_power, \
-                                      load_power, battery_soc, feed_in_power, grid_consumption, \
-                                      self_consumption, autarky_rate, surplus_power) \
-              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) \
-              """
-
         # Konvertiere Daten
         values = []
         for data in data_list:
-            values.append((
-                self._parse_timestamp(data.get('timestamp')),
-                self._parse_number(data.get('pv_power')),
-                self._parse_number(data.get('grid_power')),
-                self._parse_number(data.get('battery_power')),
-                self._parse_number(data.get('load_power')),
-                self._parse_number(data.get('battery_soc')),
-                self._parse_number(data.get('feed_in_power')),
-                self._parse_number(data.get('grid_consumption')),
-                self._parse_number(data.get('self_consumption')),
-                self._parse_number(data.get('autarky_rate')),
-                self._parse_number(data.get('surplus_power'))
-            ))
-
-        conn.executemany(sql, values)
+            row = _get_solar_values(data)
+            values.append((_parse_timestamp(row[0]),) + tuple(map(_parse_number, row[1:])))
+
+        conn.executemany(_SQL_INSERT_SOLAR, values)
         return True
 
     def _write_stats_batch(self, conn: sqlite3.Connection,
                            data_list: List[Dict[str, Any]]) -> bool:
-        """Schreibt Tagesstatistiken (akkumulierend)"""
-
+        """Schreibt Tagesstatistiken (akkumulierend per UPSERT)"""
+        # Mehrere Einträge pro Datum vorab zusammenführen (eine Zeile je Datum)
+        merged: Dict[Any, Tuple[Optional[float], ...]] = {}
         for data in data_list:
-            date_str = data.get('date')
-
-            # Prüfe ob Eintrag für dieses Datum bereits existiert
-            existing = conn.execute(
-                "SELECT * FROM daily_stats WHERE date = ?", (date_str,)
-            ).fetchone()
-
-            if existing:
-                # UPDATE: Addiere Energiewerte, aktualisiere Max-Werte
-                sql = """
-                      UPDATE daily_stats
-                      SET runtime_hours            = runtime_hours + ?,
-                          pv_energy                = pv_energy + ?,
-                          consumption_energy       = consumption_energy + ?,
-                          self_consumption_energy  = self_consumption_energy + ?,
-                          feed_in_energy           = feed_in_energy + ?,
-                          grid_energy              = grid_energy + ?,
-                          grid_energy_day          = grid_energy_day + ?,
-                          grid_energy_night        = grid_energy_night + ?,
-                          battery_charge_energy    = battery_charge_energy + ?,
-                          battery_discharge_energy = battery_discharge_energy + ?,
-                          pv_power_max             = MAX(pv_power_max, ?),
-                          consumption_power_max    = MAX(consumption_power_max, ?),
-                          feed_in_power_max        = MAX(feed_in_power_max, ?),
-                          grid_power_max           = MAX(grid_power_max, ?),
-                          surplus_power_max        = MAX(surplus_power_max, ?),
-                          battery_soc_min          = MIN(COALESCE(battery_soc_min, ?), ?),
-                          battery_soc_max          = MAX(COALESCE(battery_soc_max, ?), ?),
-                          autarky_avg              = ?,
-                          self_sufficiency_rate    = ?,
-                          cost_grid_consumption    = cost_grid_consumption + ?,
-                          revenue_feed_in          = revenue_feed_in + ?,
-                          cost_saved               = cost_saved + ?,
-                          total_benefit            = total_benefit + ?,
-                          cost_without_solar       = cost_without_solar + ?
-                      WHERE date = ? \
-                      """
-
-                values = (
-                    self._parse_number(data.get('runtime_hours')),
-                    self._parse_number(data.get('pv_energy')),
-                    self._parse_number(data.get('consumption_energy')),
-                    self._parse_number(data.get('self_consumption_energy')),
-                    self._parse_number(data.get('feed_in_energy')),
-                    self._parse_number(data.get('grid_energy')),
-                    self._parse_number(data.get('grid_energy_day')),
-                    self._parse_number(data.get('grid_energy_night')),
-                    self._parse_number(data.get('battery_charge_energy')),
-                    self._parse_number(data.get('battery_discharge_energy')),
-                    self._parse_number(data.get('pv_power_max')),
-                    self._parse_number(data.get('consumption_power_max')),
-                    self._parse_number(data.get('feed_in_power_max')),
-                    self._parse_number(data.get('grid_power_max')),
-                    self._parse_number(data.get('surplus_power_max')),
-                    self._parse_number(data.get('battery_soc_min')),
-                    self._parse_number(data.get('battery_soc_min')),
-                    self._parse_number(data.get('battery_soc_max')),
-                    self._parse_number(data.get('battery_soc_max')),
-                    self._parse_number(data.get('autarky_avg')),
-                    self._parse_number(data.get('self_sufficiency_rate')),
-                    self._parse_number(data.get('cost_grid_consumption')),
-                    self._parse_number(data.get('revenue_feed_in')),
-                    self._parse_number(data.get('cost_saved')),
-                    self._parse_number(data.get('total_benefit')),
-                    self._parse_number(data.get('cost_without_solar')),
-                    date_str
-                )
-
-                conn.execute(sql, values)
-
-            else:
-                # INSERT: Neuer Eintrag
-                sql = """
-                      INSERT INTO daily_stats (date, runtime_hours, pv_energy, consumption_energy, \
-                                               self_consumption_energy, feed_in_energy, grid_energy, \
-                                               grid_energy_day, grid_energy_night, \
-                                               battery_charge_energy, battery_discharge_energy, \
-                                               pv_power_max, consumption_power_max, feed_in_power_max, \
-                                               grid_power_max, surplus_power_max, battery_soc_min, \
-                                               battery_soc_max, autarky_avg, self_sufficiency_rate, \
-                                               cost_grid_consumption, revenue_feed_in, cost_saved, \
-                                               total_benefit, cost_without_solar) \
-                      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                      """
-
-                values = (
-                    date_str,
-                    self._parse_number(data.get('runtime_hours')),
-                    self._parse_number(data.get('pv_energy')),
-                    self._parse_number(data.get('consumption_energy')),
-                    self._parse_number(data.get('self_consumption_energy')),
-                    self._parse_number(data.get('feed_in_energy')),
-                    self._parse_number(data.get('grid_energy')),
-                    self._parse_number(data.get('grid_energy_day')),
-                    self._parse_number(data.get('grid_energy_night')),
-                    self._parse_number(data.get('battery_charge_energy')),
-                    self._parse_number(data.get('battery_discharge_energy')),
-                    self._parse_number(data.get('pv_power_max')),
-                    self._parse_number(data.get('consumption_power_max')),
-                    self._parse_number(data.get('feed_in_power_max')),
-                    self._parse_number(data.get('grid_power_max')),
-                    self._parse_number(data.get('surplus_power_max')),
-                    self._parse_number(data.get('battery_soc_min')),
-                    self._parse_number(data.get('battery_soc_max')),
-                    self._parse_number(data.get('autarky_avg')),
-                    self._parse_number(data.get('self_sufficiency_rate')),
-                    self._parse_number(data.get('cost_grid_consumption')),
-                    self._parse_number(data.get('revenue_feed_in')),
-                    self._parse_number(data.get('cost_saved')),
-                    self._parse_number(data.get('total_benefit')),
-                    self._parse_number(data.get('cost_without_solar'))
-                )
-
-                conn.execute(sql, values)
-
+            row = _get_stats_values(data)
+            date_str = row[0]
+            numbers = tuple(map(_parse_number, row[1:]))
+            previous = merged.get(date_str)
+            if previous is not None:
+                numbers = tuple(merge(old, new) for merge, old, new
+                                in zip(_STATS_MERGE, previous, numbers))
+            merged[date_str] = numbers
+
+        values = [(date_str,) + numbers for date_str, numbers in merged.items()]
+
+        # Existiert das Datum schon, werden Energiewerte addiert und Max-Werte aktualisiert
+        conn.executemany(_SQL_UPSERT_STATS, values)
         return True
 
     def _write_device_event_batch(self, conn: sqlite3.Connection,
                                   data_list: List[Dict[str, Any]]) -> bool:
         """Schreibt Geräte-Events"""
-        sql = """
-              INSERT INTO device_events (timestamp, device_name, action, old_state, new_state, \
-                                         reason, surplus_power, device_power, priority, runtime_today) \
-              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) \
-              """
-
         values = []
         for data in data_list:
-            values.append((
-                self._parse_timestamp(data.get('timestamp')),
-                data.get('device_name'),
-                data.get('action'),
-                data.get('from_state'),
-                data.get('to_state'),
-                data.get('reason'),
-                self._parse_number(data.get('surplus_power')),
-                self._parse_number(data.get('device_power')),
-                self._parse_number(data.get('priority')),
-                self._parse_number(data.get('runtime_today'))
-            ))
-
-        conn.executemany(sql, values)
+            values.append(
+                (_parse_timestamp(data['timestamp']),)
+                + _get_device_event_texts(data)
+                + tuple(map(_parse_number, _get_device_event_numbers(data)))
+            )
+
+        conn.executemany(_SQL_INSERT_DEVICE_EVENT, values)
         return True
 
     def _write_device_status_batch(self, conn: sqlite3.Connection,
                                    data_list: List[Dict[str, Any]]) -> bool:
         """Schreibt Device-Status Daten"""
-        sql = """
-              INSERT INTO device_status (timestamp, total_devices_on, total_consumption, \
-                                         surplus_power, used_surplus, device_states) \
-              VALUES (?, ?, ?, ?, ?, ?) \
-              """
-
         values = []
         for data in data_list:
             # Sammle Gerätezustände als JSON
-            device_states = {}
-
-            # Extrahiere Geräte-spezifische Daten
-            for key, value in data.items():
-                if '_state' in key or '_runtime' in key:
-                    device_states[key] = value
-
-            import json
-            device_states_json = json.dumps(device_states)
-
-            values.append((
-                self._parse_timestamp(data.get('timestamp')),
-                self._parse_number(data.get('total_on')),
-                self._parse_number(data.get('total_consumption')),
-                self._parse_number(data.get('surplus_power')),
-                self._parse_number(data.get('used_surplus')),
-                device_states_json
-            ))
-
-        conn.executemany(sql, values)
+            device_states_json = _encode_device_states({
+                key: value for key, value in data.items()
+                if key.endswith(('_state', '_runtime'))
+            })
+
+            values.append(
+                (_parse_timestamp(data['timestamp']),)
+                + tuple(map(_parse_number, _get_device_status_numbers(data)))
+                + (device_states_json,)
+            )
+
+        conn.executemany(_SQL_INSERT_DEVICE_STATUS, values)
         return True
-
-    def _parse_number(self, value: Any) -> Optional[float]:
-        """Parst eine Zahl aus formatiertem String"""
-        if value is None or value == '-':
-            return None
-
-        # Entferne Tausender-Trennzeichen und ersetze Komma
-        if isinstance(value, str):
-            value = value.replace('.', '').replace(',', '.')
-
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
-
-    def _parse_timestamp(self, value: Any) -> Optional[str]:
-        """Parst einen Timestamp"""
-        if value is None or value == '-':
-            return None
-        return str(value)
\ No newline at end of file
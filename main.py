@@ -4,56 +4,44 @@ Fronius Solar Monitor - Haupteinstiegspunkt
 
 import sys
 import time
-from pathlib import Path
-
-# Füge das Projekt-Verzeichnis zum Python-Path hinzu
-sys.path.insert(0, str(Path(__file__).parent))
 
 # WICHTIG: Dependency Check VOR allen anderen Imports!
 from cli import parse_arguments, check_dependencies, apply_args_to_config
 
-# Parse Argumente zuerst
-args = parse_arguments()
 
-# Bestimme ob API aktiviert ist (Standard: ja, außer --no-api ist gesetzt)
-api_enabled = not getattr(args, 'no_api', False)
+def main():
+    """Hauptfunktion"""
+    # Parse Argumente zuerst (--help beendet hier, ohne schwere Imports)
+    args = parse_arguments()
 
-# Dependencies prüfen (inkl. API deps wenn API aktiviert)
-if not check_dependencies(args.skip_check, with_api=api_enabled):
-    sys.exit(1)
+    # Bestimme ob API aktiviert ist (Standard: ja, außer --no-api ist gesetzt)
+    api_enabled = not getattr(args, 'no_api', False)
 
-# Erst jetzt die anderen Imports (nachdem Dependencies geprüft wurden)
-from solar_monitor import SolarMonitor, Config
+    # Dependencies prüfen (inkl. API deps wenn API aktiviert)
+    if not check_dependencies(args.skip_check, with_api=api_enabled):
+        sys.exit(1)
 
-# API Import nur wenn benötigt
-APIServer = None  # Standardwert falls Import fehlschlägt
-if api_enabled:
-    print(f"DEBUG: api_enabled = {api_enabled}")
-    try:
-        from api import APIServer
-    except ImportError:
-        print("Warnung: API-Module konnten nicht importiert werden. API wird deaktiviert.")
-        api_enabled = False
-        APIServer = None  # Explizit None setzen
+    # Erst jetzt die anderen Imports (nachdem Dependencies geprüft wurden)
+    from solar_monitor import SolarMonitor, Config
+
+    # API Import nur wenn benötigt
+    APIServer = None  # Standardwert falls Import fehlschlägt
+    if api_enabled:
+        print(f"DEBUG: api_enabled = {api_enabled}")
+        try:
+            from api import APIServer
+        except ImportError:
+            print("Warnung: API-Module konnten nicht importiert werden. API wird deaktiviert.")
+            api_enabled = False
+            APIServer = None  # Explizit None setzen
 
-def main():
-    """Hauptfunktion"""
     # Konfiguration erstellen
     config = Config()
 
     # Kommandozeilen-Argumente anwenden
+    # (inkl. --no-api, --api-host und --api-port)
     apply_args_to_config(config, args)
 
-    # API-Status explizit aus args übernehmen (falls --no-api gesetzt wurde)
-    if hasattr(args, 'no_api') and args.no_api:
-        config.api.enabled = False
-
-    # API-Host und Port aus args übernehmen wenn gesetzt
-    if hasattr(args, 'api_host') and args.api_host:
-        config.api.host = args.api_host
-    if hasattr(args, 'api_port') and args.api_port:
-        config.api.port = args.api_port
-
     # api_server vor try-Block initialisieren
     api_server = None
 
@@ -87,11 +75,21 @@ def main():
         if hasattr(args, 'simple') and args.simple:
             print("Simple Mode aktiviert - Einzeilige Ausgabe")
             try:
+                # Fester Takt auf monotoner Uhr (keine Drift durch langsame Abfragen)
+                interval = config.timing.update_interval
+                next_time = time.monotonic()
                 while True:
                     data = monitor.get_current_data()
                     if data:
                         monitor.display.show_simple(data)
-                    time.sleep(config.timing.update_interval)
+
+                    next_time += interval
+                    delay = next_time - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Im Rückstand: Takt neu ausrichten statt aufzuholen
+                        next_time = time.monotonic()
             except KeyboardInterrupt:
                 print("\nSimple Mode beendet.")
                 return
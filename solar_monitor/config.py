@@ -40,6 +40,21 @@ class LoggingConfig:
     device_log_status: bool = field(default_factory=lambda: os.getenv("DEVICE_LOG_STATUS", "True").lower() == "true")
     device_log_daily_summary: bool = field(default_factory=lambda: os.getenv("DEVICE_LOG_DAILY_SUMMARY", "True").lower() == "true")
 
+    # Batching im LogManager (1 = jeder Eintrag geht sofort an die Writer)
+    batch_size: int = field(default_factory=lambda: int(os.getenv("LOG_BATCH_SIZE", "1")))
+    batch_max_delay: float = field(default_factory=lambda: float(os.getenv("LOG_BATCH_MAX_DELAY", "5")))
+
+    # Unveränderte Geräte-Status-Einträge nicht erneut schreiben
+    dedup_device_status: bool = field(default_factory=lambda: os.getenv("LOG_DEDUP_DEVICE_STATUS", "False").lower() == "true")
+    dedup_surplus_step: float = field(default_factory=lambda: float(os.getenv("LOG_DEDUP_SURPLUS_STEP", "50")))
+
+    # Anzahl Einträge im Writer-Buffer bevor automatisch geschrieben wird
+    writer_buffer_size: int = field(default_factory=lambda: int(os.getenv("LOG_WRITER_BUFFER_SIZE", "10")))
+
+    # Writer-Aufrufe in einem Hintergrund-Thread ausführen
+    async_logging: bool = field(default_factory=lambda: os.getenv("LOG_ASYNC", "False").lower() == "true")
+    queue_size: int = field(default_factory=lambda: int(os.getenv("LOG_QUEUE_SIZE", "1000")))
+
 
 @dataclass
 class DirectoryConfig:
@@ -111,6 +126,7 @@ class DatabaseConfig:
     """Datenbank-Einstellungen"""
     enable_database: bool = field(default_factory=lambda: os.getenv("ENABLE_DATABASE", "True").lower() == "true")
     database_path: str = field(default_factory=lambda: os.getenv("DATABASE_PATH", "Datalogs/solar_energy.db"))
+    buffer_size: int = field(default_factory=lambda: int(os.getenv("DATABASE_BUFFER_SIZE", "100")))  # Zeilen pro Transaktion
 
 
 @dataclass
@@ -197,6 +213,20 @@ class Config:
         if self.connection.request_timeout < 1:
             errors.append("request_timeout muss mindestens 1 Sekunde sein")
 
+        # Logging-Validierung
+        if self.logging.batch_size < 1:
+            errors.append("logging.batch_size muss mindestens 1 sein")
+        if self.logging.dedup_surplus_step <= 0:
+            errors.append("logging.dedup_surplus_step muss größer als 0 sein")
+        if self.logging.writer_buffer_size < 1:
+            errors.append("logging.writer_buffer_size muss mindestens 1 sein")
+        if self.logging.queue_size < 1:
+            errors.append("logging.queue_size muss mindestens 1 sein")
+
+        # Datenbank-Validierung
+        if self.database.buffer_size < 1:
+            errors.append("database.buffer_size muss mindestens 1 sein")
+
         # CSV-Validierung
         if self.csv.delimiter not in [",", ";", "\t", "|"]:
             errors.append("csv.delimiter muss eines von ',', ';', '\\t', '|' sein")